@@ -0,0 +1,26 @@
+import os
+import tempfile
+
+# =======================
+# 원자적 파일 쓰기
+# =======================
+# 같은 폴더의 임시 파일에 다 쓴 뒤 os.replace로 바꿔치기하므로
+# 다른 프로그램(에디터, Unity, 다음 실행)이 반쯤 쓰인 파일을 보는 일이 없다.
+# 쓰다가 실패하면 임시 파일을 지우고 예외를 그대로 올린다.
+def write_atomic(path, data, encoding="utf-8", newline=None):
+    """data가 bytes면 그대로, str이면 encoding/newline(open과 같은 의미)으로 써서 path를 바꾼다"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        if isinstance(data, bytes):
+            f = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", encoding=encoding, newline=newline)
+        with f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,43 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# =======================
+# geometry 패키지 import 시간 측정
+# =======================
+# 생성된 짧은 스크립트가 뜨는 데 걸리는 시간을 새 파이썬 프로세스로 여러 번 재서 중앙값을 비교한다.
+#   python bench_geometry_import.py [--runs 20]
+CASES = [
+    ("python only (baseline)", "pass"),
+    ("import numpy (old eager import cost)", "import numpy"),
+    ("from geometry import sqrt, ceil", "from geometry import sqrt, ceil"),
+    ("import yuih; yuih.sqrt(2)", "import yuih; yuih.sqrt(2)"),
+    ("from geometry import normalize", "from geometry import normalize"),
+    ("from vector3d_algo import *", "from vector3d_algo import *"),
+]
+
+def time_case(code, runs):
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=here, check=True)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description="geometry 패키지의 지연 import 효과 측정")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    base = None
+    print(f"{'case':<48} {'median ms':>10} {'+ms':>8}")
+    for name, code in CASES:
+        t = time_case(code, args.runs)
+        base = t if base is None else base
+        print(f"{name:<48} {t * 1000:>10.1f} {(t - base) * 1000:>8.1f}")
+
+if __name__ == "__main__":
+    main()
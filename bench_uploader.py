@@ -0,0 +1,114 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import github_upload
+from fake_github_server import FakeGitHub
+
+# =======================
+# 업로더 처리량 벤치마크 (가짜 GitHub 서버 사용, rate limit 소모 없음)
+# =======================
+# python bench_uploader.py [--scale 0.2] [--latency 0.02] [--error-rate 0.01]
+
+def write_file(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+def make_small_files(root, scale):
+    # 작은 파일 여러 개: 요청 수(왕복 지연)가 병목
+    count = max(1, int(1000 * scale))
+    for i in range(count):
+        write_file(os.path.join(root, f"dir{i % 20}", f"file{i}.txt"), os.urandom(4 * 1024))
+
+def make_huge_files(root, scale):
+    # 큰 파일 몇 개: 스트리밍 인코딩/전송 속도가 병목 (BLOB_UPLOAD_THRESHOLD보다 크게)
+    size = max(github_upload.BLOB_UPLOAD_THRESHOLD + 1, int(24 * 1024 * 1024 * scale))
+    for i in range(3):
+        write_file(os.path.join(root, f"huge{i}.bin"), os.urandom(size))
+
+def make_duplicates(root, scale):
+    # 같은 내용 파일 여러 벌: blob 중복 제거 효과
+    count = max(5, int(300 * scale))
+    contents = [os.urandom(512 * 1024) for _ in range(5)]
+    for i in range(count):
+        write_file(os.path.join(root, f"copy{i % 10}", f"dup{i}.dat"), contents[i % len(contents)])
+
+SCENARIOS = {
+    "small": make_small_files,
+    "huge": make_huge_files,
+    "duplicates": make_duplicates,
+}
+
+def folder_stats(folder):
+    files = [os.path.join(r, f) for r, _, fs in os.walk(folder) for f in fs]
+    return len(files), sum(os.path.getsize(f) for f in files)
+
+def upload_per_file(repo, folder):
+    # 배치 이전 방식: 파일마다 contents API PUT (커밋도 파일마다)
+    base = os.path.dirname(folder)
+    for root, _, files in os.walk(folder):
+        for file in files:
+            github_upload.upload_file(repo, os.path.join(root, file), local_base_path=base)
+
+def upload_batched(repo, folder):
+    github_upload.upload_folder(repo, folder)
+
+MODES = {
+    "folder": upload_batched,
+    "per-file": upload_per_file,
+}
+
+def run_case(scenario, mode, folder, args, work_dir):
+    fake = FakeGitHub(latency=args.latency, error_rate=args.error_rate, rate_limit=args.rate_limit)
+    github_upload.GITHUB_API = fake.start()
+    github_upload.GITHUB_USER = fake.user
+    github_upload.GITHUB_TOKEN = "bench"
+    github_upload.CACHE_DIR = os.path.join(work_dir, f"cache-{scenario}-{mode}")
+    try:
+        file_count, total_bytes = folder_stats(folder)
+        github_upload.STATS.begin_batch(total_bytes)
+        started = time.perf_counter()
+        MODES[mode]("bench-repo", folder)
+        elapsed = time.perf_counter() - started
+        uploaded = len(fake.repos["bench-repo"].head_files())
+        requests_total = sum(fake.request_counts.values())
+        top = sorted(fake.request_counts.items(), key=lambda kv: -kv[1])[:3]
+        print(f"{scenario:<11} {mode:<9} {file_count:>6} {total_bytes / 2**20:>8.1f} {elapsed:>8.2f} "
+              f"{file_count / elapsed:>8.1f} {total_bytes / 2**20 / elapsed:>7.2f} {requests_total:>6} "
+              f"{fake.bytes_received / 2**20:>8.1f} {uploaded:>6}  "
+              + ", ".join(f"{k}={v}" for k, v in top))
+        if args.verbose:
+            print(github_upload.STATS.summary())
+    finally:
+        fake.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 GitHub 서버에 대한 업로드 처리량 측정")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="실행할 시나리오 (기본: 전부)")
+    parser.add_argument("--mode", choices=sorted(MODES), action="append", help="업로드 방식 (기본: 전부)")
+    parser.add_argument("--scale", type=float, default=1.0, help="파일 수/크기 배율")
+    parser.add_argument("--latency", type=float, default=0.0, help="서버 요청당 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="502 주입 확률")
+    parser.add_argument("--rate-limit", type=int, default=1_000_000)
+    parser.add_argument("-v", "--verbose", action="store_true", help="엔드포인트별 지연 요약 출력")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench_uploader_")
+    github_upload.STATS.log_dir = os.path.join(work_dir, "logs")
+    try:
+        print(f"{'scenario':<11} {'mode':<9} {'files':>6} {'MB':>8} {'sec':>8} {'files/s':>8} {'MB/s':>7} "
+              f"{'reqs':>6} {'wire MB':>8} {'stored':>6}  top endpoints")
+        for scenario in args.scenario or sorted(SCENARIOS):
+            folder = os.path.join(work_dir, scenario)
+            SCENARIOS[scenario](folder, args.scale)
+            for mode in args.mode or sorted(MODES):
+                run_case(scenario, mode, folder, args, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
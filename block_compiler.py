@@ -0,0 +1,99 @@
+import hashlib
+import json
+from collections import namedtuple
+
+# =======================
+# 블록 JSON -> 중간 표현(IR) -> 언어별 코드
+# =======================
+# 블럭타입을 언어와 상관없는 연산으로 바꿔 둔다.
+# 블록별 코드는 블록 JSON의 내용 키로 기억해 두므로 내용이 같은 블록은 다시 만들지 않고,
+# 내용이 바뀐 블록은 키가 달라져 저절로 다시 만들어진다 (따로 무효화할 필요가 없다).
+# 키는 편집기가 블록을 추가/저장할 때 한 번만 계산해 넘기면 compile에서 해시하지 않는다.
+BLOCK_KINDS = {"만들기": "declare", "붙이기": "add", "바꾸기": "assign"}
+
+BlockIR = namedtuple("BlockIR", "func kind target value")
+
+def block_key(block):
+    data = json.dumps(block, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def to_ir(block):
+    params = block.get("params", [])
+    kind = BLOCK_KINDS.get(block.get("블럭타입", "만들기"))
+    func = block["함수"]
+    target = func if kind == "declare" else block.get("target", None)
+    return BlockIR(func, kind, target, params[0] if params else 0)
+
+# ===== 백엔드 =====
+class CSharpBackend:
+    """Unity MonoBehaviour 스크립트"""
+    name = "C#"
+
+    def header(self):
+        return "using UnityEngine;\npublic class BlockScript : MonoBehaviour {"
+
+    def footer(self):
+        return "}"
+
+    def emit(self, ir):
+        lines = [f"    void {ir.func}() {{"]
+        if ir.kind == "declare":
+            lines.append(f"        float {ir.target} = {ir.value};  // 자동 생성 변수 블록")
+        elif ir.kind == "add":
+            lines.append(f"        {ir.target} += {ir.value};  // 붙이기 블록")
+        elif ir.kind == "assign":
+            lines.append(f"        {ir.target} = {ir.value};  // 바꾸기 블록")
+        lines.append("    }\n")
+        return "\n".join(lines)
+
+class PythonBackend:
+    """변수는 state 딕셔너리에 두는 파이썬 모듈"""
+    name = "Python"
+
+    def header(self):
+        return "state = {}\n"
+
+    def footer(self):
+        return ""
+
+    def emit(self, ir):
+        lines = [f"def {ir.func}():"]
+        if ir.kind == "declare":
+            lines.append(f"    state[{ir.target!r}] = {ir.value!r}  # 자동 생성 변수 블록")
+        elif ir.kind == "add":
+            lines.append(f"    state[{ir.target!r}] += {ir.value!r}  # 붙이기 블록")
+        elif ir.kind == "assign":
+            lines.append(f"    state[{ir.target!r}] = {ir.value!r}  # 바꾸기 블록")
+        else:
+            lines.append("    pass")
+        lines.append("")
+        return "\n".join(lines)
+
+# ===== 컴파일러 =====
+class BlockCompiler:
+    """블록 목록을 코드로 바꾼다. 블록별 결과를 내용 키로 기억해 두고 처음 보는 내용만 만든다."""
+    def __init__(self, backend):
+        self.backend = backend
+        self.cache = {}  # 내용 키 -> 코드
+        self.emitted = 0  # 마지막 compile에서 새로 만든 블록 수
+
+    def compile(self, blocks, keys=None):
+        """keys는 blocks와 같은 순서의 block_key 값. 없으면 여기서 계산한다"""
+        if keys is None:
+            keys = [block_key(block) for block in blocks]
+        self.emitted = 0
+        cache = {}
+        pieces = [self.backend.header()]
+        for block, key in zip(blocks, keys):
+            text = cache.get(key)
+            if text is None:
+                text = self.cache.get(key)
+            if text is None:
+                text = self.backend.emit(to_ir(block))
+                self.emitted += 1
+            cache[key] = text
+            pieces.append(text)
+        pieces.append(self.backend.footer())
+        # 지금 없는 블록의 결과는 버려서 캐시가 무한히 커지지 않게 한다
+        self.cache = cache
+        return "\n".join(pieces)
@@ -0,0 +1,200 @@
+import json
+import os
+import struct
+import threading
+import zlib
+
+from atomic_file import write_atomic
+
+# =======================
+# 블록 작업공간 저장/불러오기
+# =======================
+# 블록 하나 = {"json": 블록 JSON, "x", "y", "w", "h"}, 작업공간 = {라벨: 블록}
+# - JSON (.json): 사람이 읽을 수 있는 형식
+# - 바이너리 (.bws): 좌표는 struct로, 블록 JSON은 압축 형식으로 이어 붙인 뒤 zlib 압축
+# - 저널 (.journal): 바뀐 블록만 한 줄씩 덧붙이는 자동 저장 로그. 길어지면 스냅샷으로 합친다
+BINARY_MAGIC = b"BWS1"
+BLOCK_HEADER = struct.Struct("<iiHHI")  # x, y, w, h, JSON 길이
+
+def dumps_json(workspace):
+    return json.dumps(list(workspace.values()), ensure_ascii=False, indent=1).encode("utf-8")
+
+def loads_json(data):
+    try:
+        return {b["json"]["라벨"]: b for b in json.loads(data.decode("utf-8"))}
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"블록 작업공간 형식이 잘못되었습니다: {e!r}") from e
+
+def dumps_binary(workspace):
+    parts = [BINARY_MAGIC, struct.pack("<I", len(workspace))]
+    for b in workspace.values():
+        raw = json.dumps(b["json"], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        parts.append(BLOCK_HEADER.pack(int(b["x"]), int(b["y"]), int(b["w"]), int(b["h"]), len(raw)))
+        parts.append(raw)
+    return zlib.compress(b"".join(parts), 6)
+
+def loads_binary(data):
+    """손상된 파일은 어떤 경우든 ValueError로 알린다 (불러오기 쪽은 OSError/ValueError만 잡는다)"""
+    try:
+        data = zlib.decompress(data)
+        if data[:4] != BINARY_MAGIC:
+            raise ValueError("블록 작업공간 파일이 아닙니다.")
+        (count,) = struct.unpack_from("<I", data, 4)
+        offset = 8
+        workspace = {}
+        for _ in range(count):
+            x, y, w, h, size = BLOCK_HEADER.unpack_from(data, offset)
+            offset += BLOCK_HEADER.size
+            block = json.loads(data[offset:offset + size].decode("utf-8"))
+            offset += size
+            workspace[block["라벨"]] = {"json": block, "x": x, "y": y, "w": w, "h": h}
+    except (zlib.error, struct.error, KeyError, TypeError) as e:
+        raise ValueError(f"블록 작업공간 파일이 손상되었습니다: {e!r}") from e
+    return workspace
+
+def save_workspace(path, workspace):
+    """확장자가 .json이면 JSON, 아니면 바이너리로 저장"""
+    data = dumps_json(workspace) if path.endswith(".json") else dumps_binary(workspace)
+    write_atomic(path, data)
+
+def load_workspace(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return loads_json(data) if path.endswith(".json") else loads_binary(data)
+
+# =======================
+# 자동 저장 (바뀐 블록만 저널에 기록, 주기적으로 스냅샷 압축)
+# =======================
+class WorkspaceStore:
+    """base_path.bws(스냅샷) + base_path.journal(변경 로그).
+
+    UI 스레드는 put/delete로 바뀐 블록의 복사본만 넘기고,
+    직렬화와 파일 쓰기는 백그라운드 스레드가 interval초마다 한다.
+    """
+    def __init__(self, base_path, interval=2.0, compact_every=1000):
+        os.makedirs(os.path.dirname(os.path.abspath(base_path)), exist_ok=True)
+        self.snapshot_path = base_path + ".bws"
+        self.journal_path = base_path + ".journal"
+        self.interval = interval
+        self.compact_every = compact_every
+        self.lock = threading.Lock()  # dirty 보호
+        self.io_lock = threading.Lock()  # state와 파일 쓰기 보호
+        self.dirty = {}  # 라벨 -> 블록 (None이면 삭제)
+        self.replacement = None  # replace_all로 넘어온, 아직 스냅샷으로 쓰지 않은 작업공간
+        self.state = {}
+        self.journal_lines = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def load(self):
+        """스냅샷을 읽고 저널을 순서대로 다시 적용한 작업공간을 돌려준다. 손상됐으면 ValueError
+
+        저널 끝에 쓰다 만 줄이 있으면 마지막 온전한 줄 뒤로 잘라 낸다.
+        그대로 두면 다음 자동 저장이 그 줄 뒤에 이어 붙어서 이후 기록을 모두 읽을 수 없게 된다.
+        """
+        state = {}
+        if os.path.exists(self.snapshot_path):
+            state = load_workspace(self.snapshot_path)
+        lines = 0
+        if os.path.exists(self.journal_path):
+            good_end = 0  # 마지막 온전한 줄이 끝나는 바이트 위치
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # 줄바꿈까지 써야 온전한 줄
+                    try:
+                        entry = json.loads(line.decode("utf-8"))
+                    except ValueError:
+                        break  # 마지막 줄이 쓰다 만 줄이면 거기까지만
+                    try:
+                        if entry["block"] is None:
+                            state.pop(entry["label"], None)
+                        else:
+                            state[entry["label"]] = entry["block"]
+                    except (KeyError, TypeError) as e:
+                        raise ValueError(f"자동 저장 저널이 손상되었습니다: {e!r}") from e
+                    lines += 1
+                    good_end += len(line)
+                size = f.seek(0, os.SEEK_END)
+            if size > good_end:
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(good_end)
+        self.state = dict(state)
+        self.journal_lines = lines
+        return state
+
+    def discard(self):
+        """load()가 실패했을 때: 읽지 못한 파일은 .bad로 옮겨 두고 빈 작업공간에서 다시 시작한다"""
+        for path in (self.snapshot_path, self.journal_path):
+            if os.path.exists(path):
+                os.replace(path, path + ".bad")
+        self.state = {}
+        self.journal_lines = 0
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def put(self, label, block):
+        with self.lock:
+            self.dirty[label] = {"json": block["json"], "x": block["x"], "y": block["y"],
+                                 "w": block["w"], "h": block["h"]}
+
+    def delete(self, label):
+        with self.lock:
+            self.dirty[label] = None
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        with self.io_lock:
+            self._flush()
+
+    def _flush(self):
+        with self.lock:
+            dirty, self.dirty = self.dirty, {}
+            replacement, self.replacement = self.replacement, None
+        if replacement is not None:
+            self.state = replacement
+            self._compact()
+        if not dirty:
+            return
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            for label, block in dirty.items():
+                f.write(json.dumps({"label": label, "block": block}, ensure_ascii=False) + "\n")
+        for label, block in dirty.items():
+            if block is None:
+                self.state.pop(label, None)
+            else:
+                self.state[label] = block
+        self.journal_lines += len(dirty)
+        if self.journal_lines >= self.compact_every:
+            self._compact()
+
+    def _compact(self):
+        # 스냅샷을 먼저 바꿔 쓴 뒤 저널을 비운다 (중간에 죽어도 저널 재적용은 결과가 같다)
+        save_workspace(self.snapshot_path, self.state)
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self.journal_lines = 0
+
+    def replace_all(self, workspace):
+        """불러오기 등으로 작업공간 전체가 바뀌었을 때.
+
+        전체 직렬화는 느리므로 넘겨만 두고, 스냅샷은 자동 저장 스레드가 다음 주기에 쓴다.
+        그 전에 들어온 put/delete는 버리고, 뒤에 들어온 것은 새 스냅샷 위에 적용한다.
+        """
+        with self.lock:
+            self.dirty = {}
+            self.replacement = dict(workspace)
+
+    def close(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+        with self.io_lock:
+            self._flush()
+            if self.journal_lines:
+                self._compact()
@@ -0,0 +1,287 @@
+import argparse
+import json
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from atomic_file import write_atomic
+
+# =======================
+# C# 함수 위치 색인 (한 번의 O(n) 스캔)
+# =======================
+# 문자열/문자 리터럴/주석 안의 중괄호는 세지 않으므로 본문에 중첩된 { } 가 있어도
+# 함수 끝을 정확히 찾는다. 색인에는 함수 이름, 여는/닫는 중괄호 위치, 중괄호 깊이가 들어간다.
+FunctionSpan = namedtuple("FunctionSpan", "name start open close depth")
+
+CONTROL_WORDS = {"if", "for", "foreach", "while", "switch", "catch", "using", "lock", "fixed", "return",
+                 "new", "nameof", "typeof", "sizeof", "default", "when", "base", "this"}
+PARENS = r"\((?:[^()]|\([^()]*\))*\)"  # 괄호 한 단계 중첩까지
+# 이름<타입인자>(매개변수) [: base(...) / : this(...)] [where ...] {
+SIGNATURE_RE = re.compile(r"(?:^|[^\w.])(\w+)\s*(?:<[^<>()]*>)?\s*" + PARENS +
+                          r"\s*(?::\s*(?:base|this)\s*" + PARENS + r"\s*)?(?:where\b[^{};]*)?$", re.S)
+NEW_RE = re.compile(r"(?:^|[^\w.])new\s*$")  # new Person() { ... } 같은 객체 이니셜라이저
+
+def skip_string(src, i):
+    """i 위치의 문자열/문자 리터럴 끝 다음 위치를 돌려준다 ($ 보간 구멍 포함)"""
+    interpolated = verbatim = False
+    while src[i] in "$@":
+        interpolated |= src[i] == "$"
+        verbatim |= src[i] == "@"
+        i += 1
+    quote = src[i]
+    i += 1
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c == "\\" and not verbatim:
+            i += 2
+            continue
+        if c == quote:
+            if verbatim and src.startswith(quote * 2, i):
+                i += 2
+                continue
+            return i + 1
+        if interpolated and c == "{":
+            if src.startswith("{{", i):
+                i += 2
+                continue
+            i = skip_code(src, i + 1)
+            continue
+        if c == "\n" and not verbatim:
+            return i  # 닫히지 않은 리터럴은 줄 끝에서 끊는다
+        i += 1
+    return n
+
+def skip_comment(src, i):
+    if src.startswith("//", i):
+        end = src.find("\n", i)
+        return len(src) if end < 0 else end
+    end = src.find("*/", i + 2)
+    return len(src) if end < 0 else end + 2
+
+def is_string_start(src, i):
+    c = src[i]
+    if c in "\"'":
+        return True
+    if c in "$@":
+        j = i
+        while j < len(src) and src[j] in "$@" and j - i < 3:
+            j += 1
+        return j < len(src) and src[j] == '"'
+    return False
+
+def skip_code(src, i):
+    """보간 구멍 안의 코드를 짝이 맞는 } 다음까지 건너뛴다"""
+    depth = 0
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c == "/" and src.startswith(("//", "/*"), i):
+            i = skip_comment(src, i)
+        elif is_string_start(src, i):
+            i = skip_string(src, i)
+        elif c == "{":
+            depth += 1
+            i += 1
+        elif c == "}":
+            if depth == 0:
+                return i + 1
+            depth -= 1
+            i += 1
+        else:
+            i += 1
+    return n
+
+def index_functions(src):
+    """소스의 모든 함수(메서드, 로컬 함수) 위치를 한 번에 찾는다"""
+    spans = []
+    stack = []  # 열린 중괄호마다 (여는 위치, 함수면 (이름, 시그니처 시작 위치) 아니면 None)
+    sig = []  # 마지막 ; { } 이후의 코드 문자 (문자열/주석은 공백 하나로)
+    sig_pos = []  # sig 각 문자의 원본 위치
+    i = 0
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c == "/" and src.startswith(("//", "/*"), i):
+            sig.append(" ")
+            sig_pos.append(i)
+            i = skip_comment(src, i)
+            continue
+        if is_string_start(src, i):
+            sig.append(" ")
+            sig_pos.append(i)
+            i = skip_string(src, i)
+            continue
+        if c == "{":
+            text = "".join(sig)
+            match = SIGNATURE_RE.search(text)
+            func = None
+            if match and match.group(1) not in CONTROL_WORDS and not NEW_RE.search(text, 0, match.start(1)):
+                func = (match.group(1), sig_pos[match.start(1)])
+            stack.append((i, func))
+        elif c == "}" and stack:
+            open_pos, func = stack.pop()
+            if func:
+                spans.append(FunctionSpan(func[0], func[1], open_pos, i, len(stack)))
+        if c in "{};":
+            sig = []
+            sig_pos = []
+        else:
+            sig.append(c)
+            sig_pos.append(i)
+        i += 1
+    spans.sort(key=lambda s: s.open)
+    return spans
+
+# =======================
+# 블록 매핑 적용 (함수 단위 구간 편집)
+# =======================
+def group_mappings(block_mappings):
+    mappings_per_func = {}
+    for mapping in block_mappings:
+        mappings_per_func.setdefault(mapping["함수이름"], []).append(mapping)
+    return mappings_per_func
+
+def line_indent(src, pos):
+    line_start = src.rfind("\n", 0, pos) + 1
+    prefix = src[line_start:pos]
+    return prefix if not prefix.strip() else prefix[:len(prefix) - len(prefix.lstrip())]
+
+def rewrite_body(src, span, func_mappings, nl="\n"):
+    """바꾸기 블록은 본문을 대입문으로 바꾸고, 붙이기 블록은 닫는 중괄호 앞에 덧붙인다.
+
+    이미 들어 있는 붙이기 줄은 다시 붙이지 않으므로 같은 매핑을 여러 번 적용해도 결과가 같다.
+    """
+    close_indent = line_indent(src, span.close)
+    inner = close_indent + "    "
+    body = src[span.open + 1:span.close]
+    assign = next((m for m in func_mappings if m["블럭타입"] == "바꾸기"), None)
+    existing = set() if assign else {line.strip() for line in body.splitlines()}
+    additions = []
+    for mapping in func_mappings:
+        if mapping["블럭타입"] == "붙이기":
+            line = f"{mapping['변수이름']} += {mapping['값']};  // 붙이기 블록"
+            if line not in existing:
+                existing.add(line)
+                additions.append(inner + line)
+    if not assign and not additions:
+        return body
+    if assign:
+        lines = [f"{inner}{assign['변수이름']} = {assign['값']};  // 바꾸기 블록"]
+    elif not body.strip():
+        lines = []
+    else:
+        kept = body.rstrip()
+        head = kept.lstrip(" \t")
+        # 여는 중괄호와 같은 줄에 있던 본문은 한 줄 내려서 들여쓴다
+        lines = [head.split("\n", 1)[1]] if head.startswith(("\n", "\r\n")) else [inner + kept.strip()]
+    lines.extend(additions)
+    return nl + nl.join(lines) + nl + close_indent
+
+def apply_mappings(src, block_mappings, spans=None):
+    """매핑이 있는 함수 본문만 골라 앞에서부터 이어 붙인다 (겹치는 안쪽 함수는 건너뜀)"""
+    mappings_per_func = group_mappings(block_mappings) if isinstance(block_mappings, list) else block_mappings
+    if spans is None:
+        spans = index_functions(src)
+    nl = "\r\n" if "\r\n" in src else "\n"
+    pieces = []
+    pos = 0
+    for span in spans:
+        func_mappings = mappings_per_func.get(span.name)
+        if not func_mappings or span.open < pos:
+            continue
+        pieces.append(src[pos:span.open + 1])
+        pieces.append(rewrite_body(src, span, func_mappings, nl))
+        pos = span.close
+    if not pieces:
+        return src
+    pieces.append(src[pos:])
+    return "".join(pieces)
+
+# =======================
+# 여러 .cs 파일 일괄 처리 (프로세스 풀 + 파일별 색인 캐시)
+# =======================
+def file_signature(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+def process_file(path, mappings_per_func, spans=None):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        src = f.read()
+    # BOM은 떼고 색인하되, 있던 파일은 다시 쓸 때 붙인다 (Visual Studio가 만든 파일은 대부분 BOM이 있다)
+    bom = src.startswith("\ufeff")
+    if bom:
+        src = src[1:]
+    if spans is None:
+        spans = index_functions(src)
+    else:
+        spans = [FunctionSpan(*s) for s in spans]
+    new_src = apply_mappings(src, mappings_per_func, spans)
+    changed = new_src != src
+    if changed:
+        write_atomic(path, new_src, "utf-8-sig" if bom else "utf-8", newline="")
+        spans = index_functions(new_src)
+    return path, file_signature(path), [list(s) for s in spans], changed
+
+def load_cache(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def expand_cs_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                for file in files:
+                    if file.endswith(".cs"):
+                        yield os.path.join(root, file)
+        else:
+            yield path
+
+def rewrite_files(paths, block_mappings, cache_path=None, workers=None):
+    """여러 .cs 파일에 매핑을 적용한다. 색인 캐시가 최신이고 매핑 대상 함수가 없는 파일은 읽지도 않는다.
+
+    반환값은 바뀐 파일 경로 목록.
+    """
+    mappings_per_func = group_mappings(block_mappings)
+    cache = load_cache(cache_path) if cache_path else {}
+    jobs = []
+    for path in expand_cs_paths(paths):
+        path = os.path.abspath(path)
+        entry = cache.get(path)
+        if entry and entry["sig"] == file_signature(path):
+            if not any(span[0] in mappings_per_func for span in entry["spans"]):
+                continue
+            jobs.append((path, entry["spans"]))
+        else:
+            jobs.append((path, None))
+    changed_files = []
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_file, path, mappings_per_func, spans) for path, spans in jobs]
+            for future in futures:
+                path, sig, spans, changed = future.result()
+                cache[path] = {"sig": sig, "spans": spans}
+                if changed:
+                    changed_files.append(path)
+    if cache_path:
+        write_atomic(cache_path, json.dumps(cache, ensure_ascii=False))
+    return changed_files
+
+def main():
+    parser = argparse.ArgumentParser(description="블록 매핑을 .cs 파일들의 함수 본문에 적용")
+    parser.add_argument("mappings", help="블록 매핑 JSON 파일 (sdfsdf.py의 block_mappings 형식)")
+    parser.add_argument("paths", nargs="+", help=".cs 파일 또는 폴더")
+    parser.add_argument("--cache", default=".cs_index_cache.json", help="파일별 함수 색인 캐시")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    with open(args.mappings, "r", encoding="utf-8") as f:
+        block_mappings = json.load(f)
+    for path in rewrite_files(args.paths, block_mappings, args.cache, args.workers):
+        print(f"Updated: {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+import argparse
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# =======================
+# 로컬 GitHub API 대역 서버 (업로더 벤치마크/회귀 테스트용)
+# =======================
+# github_upload.py가 쓰는 엔드포인트만 구현한다:
+#   GET  /user/repos                      (페이지네이션, ETag/304)
+#   GET  /repos/{user}/{repo}
+#   GET  /repos/{user}/{repo}/contents/{path}  (ETag/304)
+#   PUT  /repos/{user}/{repo}/contents/{path}
+#   POST /repos/{user}/{repo}/git/blobs|trees|commits
+#   GET  /repos/{user}/{repo}/git/trees/{sha}[?recursive=1]
+#   GET  /repos/{user}/{repo}/git/commits/{sha}
+#   GET  /repos/{user}/{repo}/git/ref/heads/{branch}
+#   PATCH /repos/{user}/{repo}/git/refs/heads/{branch}
+
+def git_sha(kind, data):
+    return hashlib.sha1(f"{kind} {len(data)}\0".encode() + data).hexdigest()
+
+class FakeRepo:
+    def __init__(self, name, private=False, empty=False):
+        self.name = name
+        self.private = private
+        self.default_branch = "main"
+        self.blobs = {}
+        self.trees = {}  # 트리 SHA -> {파일 경로: blob SHA}
+        self.commits = {}
+        self.refs = {}
+        if not empty:
+            self.commit({}, "Initial commit", [])
+
+    def store_tree(self, files):
+        sha = git_sha("tree", json.dumps(sorted(files.items())).encode())
+        self.trees[sha] = dict(files)
+        return sha
+
+    def store_commit(self, tree_sha, message, parents):
+        data = json.dumps([tree_sha, message, parents, time.time()]).encode()
+        sha = git_sha("commit", data)
+        self.commits[sha] = {"tree": tree_sha, "message": message, "parents": parents}
+        return sha
+
+    def commit(self, files, message, parents):
+        sha = self.store_commit(self.store_tree(files), message, parents)
+        self.refs[self.default_branch] = sha
+        return sha
+
+    def head_files(self):
+        head = self.refs.get(self.default_branch)
+        if head is None:
+            return {}
+        return self.trees[self.commits[head]["tree"]]
+
+    def add_blob(self, data):
+        sha = git_sha("blob", data)
+        self.blobs[sha] = data
+        return sha
+
+def list_tree(files):
+    """평평한 {경로: sha}를 GitHub 재귀 트리 응답 형식으로 (폴더 항목 포함)"""
+    entries = {}
+    for path, sha in files.items():
+        parts = path.split("/")
+        for i in range(1, len(parts)):
+            folder = "/".join(parts[:i])
+            entries.setdefault(folder, {"path": folder, "mode": "040000", "type": "tree", "sha": git_sha("tree", folder.encode())})
+        entries[path] = {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+    return [entries[p] for p in sorted(entries)]
+
+class FakeGitHub:
+    """스레드에서 도는 가짜 GitHub API. latency(초), error_rate(0~1), rate_limit(rate_window초당 요청 수)를 설정할 수 있다."""
+    def __init__(self, user="bench", repos=("bench-repo",), latency=0.0, error_rate=0.0, rate_limit=5000,
+                 page_size=100, host="127.0.0.1", port=0, rate_window=3600):
+        self.user = user
+        self.repos = {name: FakeRepo(name) for name in repos}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.rate_remaining = rate_limit
+        self.rate_reset = int(time.time()) + rate_window
+        self.page_size = page_size
+        self.lock = threading.Lock()
+        self.request_counts = {}
+        self.bytes_received = 0
+        self.server = ThreadingHTTPServer((host, port), self.make_handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset_counts(self):
+        with self.lock:
+            self.request_counts = {}
+            self.bytes_received = 0
+
+    def make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                fake.handle(self, "GET")
+
+            def do_PUT(self):
+                fake.handle(self, "PUT")
+
+            def do_POST(self):
+                fake.handle(self, "POST")
+
+            def do_PATCH(self):
+                fake.handle(self, "PATCH")
+
+        return Handler
+
+    # ===== 요청 처리 =====
+    def handle(self, req, method):
+        length = int(req.headers.get("Content-Length", 0))
+        raw = req.rfile.read(length) if length else b""
+        parsed = urllib.parse.urlparse(req.path)
+        parts = [urllib.parse.unquote(p) for p in parsed.path.strip("/").split("/")]
+        query = urllib.parse.parse_qs(parsed.query)
+        with self.lock:
+            key = f"{method} {route_name(parts)}"
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+            self.bytes_received += len(raw)
+            now = time.time()
+            if now >= self.rate_reset:
+                # 초기화 시각이 지나면 한도를 다시 채운다
+                self.rate_remaining = self.rate_limit
+                self.rate_reset = int(now) + self.rate_window
+            # 남은 요청이 있을 때만 차감한다 (한도가 3이면 세 번째 요청까지 성공)
+            limited = self.rate_remaining == 0
+            if not limited:
+                self.rate_remaining -= 1
+            remaining = self.rate_remaining
+            reset = self.rate_reset
+        if self.latency:
+            time.sleep(self.latency)
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+        }
+        if limited:
+            return self.respond(req, 403, {"message": "API rate limit exceeded"}, headers)
+        if self.error_rate and random.random() < self.error_rate:
+            return self.respond(req, 502, {"message": "Injected error"}, headers)
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            return self.respond(req, 400, {"message": "Problems parsing JSON"}, headers)
+        with self.lock:
+            status, payload = self.dispatch(method, parts, query, body)
+        if status == 200 and method == "GET":
+            etag = '"' + hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest() + '"'
+            headers["ETag"] = etag
+            if req.headers.get("If-None-Match") == etag:
+                # GitHub처럼 304는 한도에서 빼지 않는다
+                with self.lock:
+                    if self.rate_reset == reset:
+                        self.rate_remaining += 1
+                    headers["X-RateLimit-Remaining"] = str(self.rate_remaining)
+                return self.respond(req, 304, None, headers)
+        if isinstance(payload, tuple):
+            payload, link = payload
+            headers["Link"] = link
+        self.respond(req, status, payload, headers)
+
+    def respond(self, req, status, payload, headers):
+        data = b"" if payload is None else json.dumps(payload).encode()
+        req.send_response(status)
+        for name, value in headers.items():
+            req.send_header(name, value)
+        req.send_header("Content-Type", "application/json")
+        req.send_header("Content-Length", str(len(data)))
+        req.end_headers()
+        req.wfile.write(data)
+
+    def dispatch(self, method, parts, query, body):
+        if parts[:2] == ["user", "repos"] and method == "GET":
+            return self.list_repos(query)
+        if len(parts) < 3 or parts[0] != "repos" or parts[1] != self.user or parts[2] not in self.repos:
+            return 404, {"message": "Not Found"}
+        repo = self.repos[parts[2]]
+        rest = parts[3:]
+        if not rest and method == "GET":
+            return 200, {"name": repo.name, "private": repo.private, "default_branch": repo.default_branch}
+        if rest and rest[0] == "contents":
+            return self.contents(repo, method, "/".join(p for p in rest[1:] if p), body)
+        if rest[:1] == ["git"] and len(rest) >= 2:
+            return self.git(repo, method, rest[1:], body)
+        return 404, {"message": "Not Found"}
+
+    def list_repos(self, query):
+        names = sorted(self.repos)
+        per_page = min(int(query.get("per_page", ["30"])[0]), self.page_size)
+        page = int(query.get("page", ["1"])[0])
+        last = max(1, -(-len(names) // per_page))
+        items = [{"name": n, "private": self.repos[n].private} for n in names[(page - 1) * per_page:page * per_page]]
+        link = ""
+        if last > 1:
+            base = f"{self.url}/user/repos?per_page={per_page}"
+            link = f'<{base}&page={min(page + 1, last)}>; rel="next", <{base}&page={last}>; rel="last"'
+        return 200, (items, link)
+
+    def contents(self, repo, method, path, body):
+        files = repo.head_files()
+        if method == "GET":
+            if path in files:
+                sha = files[path]
+                return 200, {"type": "file", "name": path.rsplit("/", 1)[-1], "path": path, "sha": sha,
+                             "encoding": "base64", "content": base64.b64encode(repo.blobs.get(sha, b"")).decode()}
+            prefix = f"{path}/" if path else ""
+            children = {}
+            for file_path in files:
+                if not file_path.startswith(prefix):
+                    continue
+                name, _, below = file_path[len(prefix):].partition("/")
+                children[name] = {"type": "dir" if below else "file", "name": name, "path": prefix + name}
+            if not children:
+                return 404, {"message": "Not Found"}
+            return 200, [children[n] for n in sorted(children)]
+        if method == "PUT":
+            if path in files and body.get("sha") != files[path]:
+                return 422, {"message": '"sha" wasn\'t supplied.'}
+            sha = repo.add_blob(base64.b64decode(body.get("content", "")))
+            new_files = dict(files)
+            new_files[path] = sha
+            parents = [repo.refs[repo.default_branch]] if repo.refs else []
+            commit_sha = repo.commit(new_files, body.get("message", ""), parents)
+            return (200 if path in files else 201), {"content": {"path": path, "sha": sha}, "commit": {"sha": commit_sha}}
+        return 405, {"message": "Method Not Allowed"}
+
+    def git(self, repo, method, rest, body):
+        kind = rest[0]
+        if kind == "blobs" and method == "POST":
+            if not repo.refs:
+                return 409, {"message": "Git Repository is empty."}
+            return 201, {"sha": repo.add_blob(base64.b64decode(body.get("content", "")))}
+        if kind == "trees" and method == "POST":
+            base = repo.trees.get(body.get("base_tree"), {}) if body.get("base_tree") else {}
+            files = dict(base)
+            for entry in body.get("tree", []):
+                if entry.get("sha") is None:
+                    if entry["path"] not in files:
+                        return 422, {"message": "GitRPC::BadObjectState"}
+                    del files[entry["path"]]
+                elif entry["sha"] not in repo.blobs:
+                    return 422, {"message": f"Invalid tree info: {entry['sha']}"}
+                else:
+                    files[entry["path"]] = entry["sha"]
+            return 201, {"sha": repo.store_tree(files)}
+        if kind == "trees" and method == "GET" and len(rest) == 2:
+            files = repo.trees.get(rest[1])
+            if files is None:
+                return 404, {"message": "Not Found"}
+            return 200, {"sha": rest[1], "tree": list_tree(files), "truncated": False}
+        if kind == "commits" and method == "POST":
+            if body.get("tree") not in repo.trees:
+                return 422, {"message": "Tree SHA does not exist"}
+            sha = repo.store_commit(body["tree"], body.get("message", ""), body.get("parents", []))
+            return 201, {"sha": sha}
+        if kind == "commits" and method == "GET" and len(rest) == 2:
+            commit = repo.commits.get(rest[1])
+            if commit is None:
+                return 404, {"message": "Not Found"}
+            return 200, {"sha": rest[1], "tree": {"sha": commit["tree"]}, "message": commit["message"]}
+        if kind == "ref" and method == "GET" and rest[1:2] == ["heads"]:
+            if not repo.refs:
+                return 409, {"message": "Git Repository is empty."}
+            sha = repo.refs.get("/".join(rest[2:]))
+            if sha is None:
+                return 404, {"message": "Not Found"}
+            return 200, {"ref": f"refs/heads/{'/'.join(rest[2:])}", "object": {"sha": sha, "type": "commit"}}
+        if kind == "refs" and method == "PATCH" and rest[1:2] == ["heads"]:
+            branch = "/".join(rest[2:])
+            if body.get("sha") not in repo.commits:
+                return 422, {"message": "Object does not exist"}
+            repo.refs[branch] = body["sha"]
+            return 200, {"ref": f"refs/heads/{branch}", "object": {"sha": body["sha"], "type": "commit"}}
+        return 404, {"message": "Not Found"}
+
+def route_name(parts):
+    if parts[:2] == ["user", "repos"]:
+        return "user/repos"
+    rest = parts[3:]
+    if not rest:
+        return "repos/{repo}"
+    if rest[0] == "git" and len(rest) > 1:
+        return f"git/{rest[1]}"
+    return rest[0]
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 GitHub API 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--user", default="bench")
+    parser.add_argument("--repo", action="append", help="만들 저장소 이름 (여러 번 지정 가능)")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청마다 넣을 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="502를 돌려줄 확률 (0~1)")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="시간당 요청 한도")
+    args = parser.parse_args()
+    fake = FakeGitHub(user=args.user, repos=args.repo or ["bench-repo"], latency=args.latency,
+                      error_rate=args.error_rate, rate_limit=args.rate_limit, port=args.port)
+    print(f"Fake GitHub API on {fake.url}  (GITHUB_API_URL={fake.url} GITHUB_USER={args.user} GITHUB_TOKEN=any)")
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
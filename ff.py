@@ -1,43 +1,180 @@
 import sys
 import os
+import posixpath
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import shiboken6
 from PySide6.QtWidgets import QApplication, QMainWindow
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtCore import QUrl
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
+from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtCore import QFile, QIODevice, QObject, QUrl, Signal, Slot
+from atomic_file import write_atomic
+from template_splice import splice_file
+
+STARTED = time.perf_counter()
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "blockly_host")
+# 캐시는 URL(출처) 기준이므로 포트가 바뀌면 첫 실행처럼 다시 받는다. 고정 포트가 사용 중일 때만 임의 포트로
+HOST_PORT = int(os.getenv("BLOCKLY_HOST_PORT", "8767"))
+
+# =======================
+# 로컬 HTTP 출처 (file:// 응답은 디스크 캐시/V8 코드 캐시에 남지 않는다)
+# =======================
+class BlocklyRequestHandler(SimpleHTTPRequestHandler):
+    """blockly.html, blockly/ 아래 파일, qwebchannel.js만 돌려준다 (나머지 저장소 파일은 404)"""
+    qwebchannel_js = b""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=BASE_DIR, **kwargs)
+
+    def log_message(self, *args):
+        pass
+
+    def request_path(self):
+        return posixpath.normpath(urllib.parse.unquote(self.path.split("?", 1)[0]))
+
+    def allowed(self):
+        path = self.request_path()
+        return path == "/blockly.html" or path.startswith("/blockly/")
+
+    def do_HEAD(self):
+        if not self.allowed():
+            self.send_error(404)
+            return
+        super().do_HEAD()
+
+    def do_GET(self):
+        if self.request_path() == "/qwebchannel.js":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/javascript")
+            self.send_header("Content-Length", str(len(self.qwebchannel_js)))
+            self.send_header("Cache-Control", "max-age=86400")
+            self.end_headers()
+            self.wfile.write(self.qwebchannel_js)
+            return
+        if not self.allowed():
+            self.send_error(404)
+            return
+        super().do_GET()
+
+    def end_headers(self):
+        # 라이브러리는 하루 동안 그대로 쓰고, 페이지는 매번 Last-Modified로 확인(304)한다
+        path = self.request_path()
+        if path.startswith("/blockly/"):
+            self.send_header("Cache-Control", "max-age=86400")
+        elif path == "/blockly.html":
+            self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+def start_server():
+    # qwebchannel.js는 Qt 리소스에 있는데, http 페이지에서는 qrc:를 불러올 수 없으므로 같은 출처로 내준다
+    f = QFile(":/qtwebchannel/qwebchannel.js")
+    if f.open(QIODevice.OpenModeFlag.ReadOnly):
+        BlocklyRequestHandler.qwebchannel_js = bytes(f.readAll())
+        f.close()
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", HOST_PORT), BlocklyRequestHandler)
+    except OSError:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), BlocklyRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def log_startup(warm, ok):
+    # 캐시 없는 첫 실행(cold)과 두 번째 실행부터(warm)의 로드 시간을 비교할 수 있게 남긴다
+    elapsed = (time.perf_counter() - STARTED) * 1000
+    line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} {'warm' if warm else 'cold'} {elapsed:.0f}ms{'' if ok else ' (load failed)'}"
+    print(f"startup: {line}")
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        with open(os.path.join(PROFILE_DIR, "startup.log"), "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        pass
+
+# =======================
+# JS -> Python 브리지 (blockly.html의 window.qtBridge)
+# =======================
+class PythonBridge(QObject):
+    status = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+        # 저장 순서가 뒤바뀌지 않도록 작업자 하나로 UI 스레드 밖에서 쓴다
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    @Slot(str)
+    def appendChunk(self, chunk):
+        self.chunks.append(chunk)
+
+    @Slot()
+    def finishFile(self):
+        code = "".join(self.chunks)
+        self.chunks = []
+        self.executor.submit(self.write_code, code)
+
+    @Slot(str)
+    def saveFile(self, code):
+        self.executor.submit(self.write_code, code)
+
+    def write_code(self, code):
+        # 생성된 코드는 block.txt로 저장하고, temp_main.py가 있으면 main.py까지 만든다
+        block_path = os.path.join(BASE_DIR, "block.txt")
+        template_path = os.path.join(BASE_DIR, "temp_main.py")
+        try:
+            write_atomic(block_path, code)
+            if os.path.exists(template_path):
+                splice_file(template_path, block_path, os.path.join(BASE_DIR, "main.py"))
+        except OSError as e:
+            self.status.emit(f"저장 실패: {e}")
+            return
+        self.status.emit(f"저장됨: {block_path} ({len(code)}자)")
 
 app = QApplication(sys.argv)
 window = QMainWindow()
 window.setWindowTitle("Blockly Python GUI (Local)")
 window.resize(1000, 700)
 
+# 이름 있는 프로필은 HTTP/코드 캐시를 디스크에 남기므로 두 번째 실행부터 Blockly를 다시 파싱하지 않는다
+warm_start = os.path.isdir(os.path.join(PROFILE_DIR, "cache"))
+profile = QWebEngineProfile("blockly", app)
+profile.setPersistentStoragePath(os.path.join(PROFILE_DIR, "storage"))
+profile.setCachePath(os.path.join(PROFILE_DIR, "cache"))
+profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+
 # WebEngineView 생성
 webview = QWebEngineView()
+page = QWebEnginePage(profile, webview)
+webview.setPage(page)
 
-# HTML 경로
-html_path = os.path.join(os.path.dirname(__file__), "blockly.html")
-webview.load(QUrl.fromLocalFile(os.path.abspath(html_path)))
-
-window.setCentralWidget(webview)
-window.show()
-sys.exit(app.exec())
-
+bridge = PythonBridge()
+bridge.status.connect(window.statusBar().showMessage)
+channel = QWebChannel(page)
+channel.registerObject("qtBridge", bridge)
+page.setWebChannel(channel)
+app.aboutToQuit.connect(lambda: bridge.executor.shutdown(wait=True))
 
+# 첫 로드가 끝날 때까지 걸린 시간을 남긴다
+def on_first_load(ok):
+    page.loadFinished.disconnect(on_first_load)
+    log_startup(warm_start, ok)
 
-# block.txt 전체 내용 읽기
-with open("block.txt", "r", encoding="utf-8") as f:
-    block_data = f.read()
+page.loadFinished.connect(on_first_load)
 
-# temp_main.py 줄 단위로 읽기
-with open("temp_main.py", "r", encoding="utf-8") as f:
-    lines = f.readlines()
+server = start_server()
+host, port = server.server_address[:2]
+webview.load(QUrl(f"http://{host}:{port}/blockly.html"))
 
-# "//블록" 있는 줄에 block_data 삽입
-resultcount = ""
-for line in lines:
-    if "//블록" in line:
-        resultcount += block_data + "\n"  # 삽입 후 줄바꿈 추가
-    else:
-        resultcount += line  # 원래 줄 그대로 추가
-
-# 결과를 main.py에 저장
-with open("main.py", "w", encoding="utf-8") as f:
-    f.write(resultcount)
+window.setCentralWidget(webview)
+window.show()
+exit_code = app.exec()
+server.shutdown()
+# 페이지가 남아 있는 채로 프로필이 지워지면 캐시가 디스크에 다 쓰이지 않으므로 page부터 지운다
+shiboken6.delete(page)
+shiboken6.delete(profile)
+sys.exit(exit_code)
@@ -1,14 +1,24 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 import json
+import os
+from block_workspace import WorkspaceStore, load_workspace, save_workspace
+from block_compiler import BlockCompiler, CSharpBackend, PythonBackend, block_key
 
 root = tk.Tk()
 root.title("자동 블록코딩 + C# 변환 예제")
-root.geometry("800x500")
+root.geometry("800x600")
 
-# Canvas 생성
-canvas = tk.Canvas(root, bg="white", width=750, height=300)
-canvas.pack(padx=5, pady=5)
+# Canvas 생성 (블록이 많으면 스크롤해서 본다)
+WORLD_W, WORLD_H = 4000, 4000
+canvas_frame = tk.Frame(root)
+canvas_frame.pack(padx=5, pady=5)
+canvas = tk.Canvas(canvas_frame, bg="white", width=750, height=300, scrollregion=(0, 0, WORLD_W, WORLD_H))
+hbar = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL)
+vbar = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL)
+canvas.grid(row=0, column=0)
+vbar.grid(row=0, column=1, sticky="ns")
+hbar.grid(row=1, column=0, sticky="ew")
 
 # 예시 블록 JSON
 blocks_json = """
@@ -22,70 +32,264 @@ blocks_json = """
 blocks_data = json.loads(blocks_json)
 blocks = {}
 
-# 블록 생성
-for i, b in enumerate(blocks_data):
-    x, y, w, h = 50, 50 + i*60, 150, 40
-    rect = canvas.create_rectangle(x, y, x+w, y+h, fill="lightblue")
-    text = canvas.create_text(x+w/2, y+h/2, text=b["라벨"])
-    blocks[b["라벨"]] = {"json": b, "x": x, "y": y, "w": w, "h": h, "rect": rect, "text": text}
+# 격자 공간 인덱스: 클릭 위치가 속한 칸의 블록만 검사한다
+class GridIndex:
+    def __init__(self, cell=100):
+        self.cell = cell
+        self.cells = {}
+
+    def _keys(self, x, y, w, h):
+        c = self.cell
+        for cx in range(int(x // c), int((x + w) // c) + 1):
+            for cy in range(int(y // c), int((y + h) // c) + 1):
+                yield cx, cy
+
+    def insert(self, label, b):
+        for key in self._keys(b["x"], b["y"], b["w"], b["h"]):
+            self.cells.setdefault(key, set()).add(label)
+
+    def remove(self, label, b):
+        for key in self._keys(b["x"], b["y"], b["w"], b["h"]):
+            cell = self.cells.get(key)
+            if cell:
+                cell.discard(label)
+                if not cell:
+                    del self.cells[key]
+
+    def query_point(self, x, y):
+        return self.cells.get((int(x // self.cell), int(y // self.cell)), ())
+
+    def query_rect(self, x0, y0, x1, y1):
+        found = set()
+        for key in self._keys(x0, y0, x1 - x0, y1 - y0):
+            found.update(self.cells.get(key, ()))
+        return found
+
+grid = GridIndex()
+
+# 코드 생성 (블록별 결과를 내용 키로 기억해 두고 바뀐 블록만 다시 만든다)
+csharp_compiler = BlockCompiler(CSharpBackend())
+python_compiler = BlockCompiler(PythonBackend())
+
+def put_block(label):
+    # 자동 저장 대상에 넣는다. 블록 JSON이 바뀌었을 수 있으므로 내용 키도 다시 계산한다 (위치는 키에 안 들어감)
+    b = blocks[label]
+    b["key"] = block_key(b["json"])
+    store.put(label, b)
+
+# 블록 생성 (캔버스 아이템은 화면에 보일 때만 만든다)
+# order는 코드 생성/저장 순서, z는 화면에서 쌓인 순서 (클릭하면 맨 위로 올라간다)
+next_z = 0
+
+def add_block(b, x, y, w=150, h=40):
+    global next_z
+    order = len(blocks)
+    blocks[b["라벨"]] = {"json": b, "x": x, "y": y, "w": w, "h": h, "rect": None, "text": None,
+                        "order": order, "z": next_z, "tag": f"block{order}", "key": block_key(b)}
+    next_z += 1
+    grid.insert(b["라벨"], blocks[b["라벨"]])
+
+def draw_block(b):
+    b["rect"] = canvas.create_rectangle(b["x"], b["y"], b["x"]+b["w"], b["y"]+b["h"], fill="lightblue",
+                                        tags=("block", b["tag"]))
+    b["text"] = canvas.create_text(b["x"]+b["w"]/2, b["y"]+b["h"]/2, text=b["json"]["라벨"],
+                                   tags=("block", b["tag"]))
+
+def undraw_block(b):
+    canvas.delete(b["tag"])
+    b["rect"] = b["text"] = None
+
+def visible_rect():
+    x0, y0 = canvas.canvasx(0), canvas.canvasy(0)
+    return x0, y0, x0 + canvas.winfo_width(), y0 + canvas.winfo_height()
+
+drawn = set()
+viewport_pending = False
+
+def redraw_viewport():
+    global viewport_pending, drawn
+    viewport_pending = False
+    visible = grid.query_rect(*visible_rect())
+    if selected:
+        visible.add(selected)
+    for label in drawn - visible:
+        undraw_block(blocks[label])
+    new = visible - drawn
+    for label in new:
+        draw_block(blocks[label])
+    if new:
+        # 새로 그린 블록은 캔버스 맨 위에 생기므로 보이는 블록 전체를 z 순서로 다시 쌓는다
+        for label in sorted(visible, key=lambda lb: blocks[lb]["z"]):
+            canvas.tag_raise(blocks[label]["tag"])
+    drawn = visible
+
+def schedule_viewport():
+    global viewport_pending
+    if not viewport_pending:
+        viewport_pending = True
+        root.after_idle(redraw_viewport)
+
+def xview(*args):
+    canvas.xview(*args)
+    schedule_viewport()
+
+def yview(*args):
+    canvas.yview(*args)
+    schedule_viewport()
+
+hbar.config(command=xview)
+vbar.config(command=yview)
+canvas.config(xscrollcommand=hbar.set, yscrollcommand=vbar.set)
+canvas.bind("<Configure>", lambda event: schedule_viewport())
+
+# 작업공간: 자동 저장된 것이 있으면 불러오고, 없으면 예시 블록으로 시작
+LOAD_BATCH = 200
+AUTOSAVE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "block_editor")
+store = WorkspaceStore(os.path.join(AUTOSAVE_DIR, "workspace"))
+load_generation = 0
+
+def stream_blocks(records, start=0, generation=None):
+    # 큰 작업공간도 UI가 멈추지 않도록 LOAD_BATCH개씩 나눠서 올린다
+    if generation is None:
+        generation = load_generation
+    if generation != load_generation:
+        return  # 그 사이 다른 파일을 불러왔다
+    end = start + LOAD_BATCH
+    for rec in records[start:end]:
+        add_block(rec["json"], rec["x"], rec["y"], rec["w"], rec["h"])
+    schedule_viewport()
+    if end < len(records):
+        root.after_idle(lambda: stream_blocks(records, end, generation))
+
+try:
+    saved_workspace = store.load()
+except (OSError, ValueError) as e:
+    messagebox.showwarning("자동 저장 복구 실패", f"{e}\n\n예시 블록으로 시작합니다. (읽지 못한 파일은 .bad로 남겨 둡니다)")
+    store.discard()
+    saved_workspace = None
+if saved_workspace:
+    stream_blocks(list(saved_workspace.values()))
+else:
+    for i, b in enumerate(blocks_data):
+        add_block(b, 50, 50 + i*60)
+        put_block(b["라벨"])
+store.start()
 
 # 드래그 & 드롭
 selected = None
 offset_x = 0
 offset_y = 0
+drag_pos = None  # 마지막 모션 이벤트 위치 (프레임당 한 번만 반영)
+drag_pending = False
 
 def select_block(event):
-    global selected, offset_x, offset_y
-    for label, b in blocks.items():
-        if b["x"] <= event.x <= b["x"]+b["w"] and b["y"] <= event.y <= b["y"]+b["h"]:
-            selected = label
-            offset_x = event.x - b["x"]
-            offset_y = event.y - b["y"]
-            break
+    global selected, offset_x, offset_y, next_z
+    x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
+    hits = [label for label in grid.query_point(x, y)
+            if blocks[label]["x"] <= x <= blocks[label]["x"]+blocks[label]["w"]
+            and blocks[label]["y"] <= y <= blocks[label]["y"]+blocks[label]["h"]]
+    if hits:
+        # 겹쳐 있으면 화면에서 맨 위에 보이는 블록을 잡고, 다시 맨 위로 올린다
+        selected = max(hits, key=lambda label: blocks[label]["z"])
+        b = blocks[selected]
+        offset_x = x - b["x"]
+        offset_y = y - b["y"]
+        b["z"] = next_z
+        next_z += 1
+        canvas.tag_raise(b["tag"])
 
 def drag_block(event):
-    global selected
+    global drag_pos, drag_pending
     if selected:
-        b = blocks[selected]
-        b["x"] = event.x - offset_x
-        b["y"] = event.y - offset_y
-        canvas.coords(b["rect"], b["x"], b["y"], b["x"]+b["w"], b["y"]+b["h"])
-        canvas.coords(b["text"], b["x"]+b["w"]/2, b["y"]+b["h"]/2)
+        drag_pos = (canvas.canvasx(event.x), canvas.canvasy(event.y))
+        if not drag_pending:
+            drag_pending = True
+            root.after_idle(apply_drag)
+
+def apply_drag():
+    global drag_pending
+    drag_pending = False
+    if not selected or drag_pos is None:
+        return
+    b = blocks[selected]
+    new_x, new_y = drag_pos[0] - offset_x, drag_pos[1] - offset_y
+    grid.remove(selected, b)
+    canvas.move(b["tag"], new_x - b["x"], new_y - b["y"])
+    b["x"], b["y"] = new_x, new_y
+    grid.insert(selected, b)
 
 def release_block(event):
-    global selected
+    global selected, drag_pos
+    if drag_pending:
+        apply_drag()
+    if selected:
+        put_block(selected)  # 옮긴 블록만 자동 저장 대상으로
     selected = None
+    drag_pos = None
+    schedule_viewport()
 
 canvas.bind("<Button-1>", select_block)
 canvas.bind("<B1-Motion>", drag_block)
 canvas.bind("<ButtonRelease-1>", release_block)
 
-# C# 코드 생성
+# 코드 생성
+def compile_blocks(compiler):
+    ordered = sorted(blocks.values(), key=lambda b: b["order"])
+    return compiler.compile([b["json"] for b in ordered], [b["key"] for b in ordered])
+
 def generate_csharp():
-    lines = []
-    lines.append("using UnityEngine;\npublic class BlockScript : MonoBehaviour {")
-    for label, b in blocks.items():
-        block = b["json"]
-        fname = block["함수"]
-        btype = block.get("블럭타입", "만들기")
-        params = block.get("params", [])
-        target = block.get("target", None)
-        lines.append(f"    void {fname}() {{")
-        if btype == "만들기":
-            val = params[0] if params else 0
-            lines.append(f"        float {fname} = {val};  // 자동 생성 변수 블록")
-        elif btype == "붙이기":
-            val = params[0] if params else 0
-            lines.append(f"        {target} += {val};  // 붙이기 블록")
-        elif btype == "바꾸기":
-            val = params[0] if params else 0
-            lines.append(f"        {target} = {val};  // 바꾸기 블록")
-        lines.append("    }\n")
-    lines.append("}")
-    print("\n".join(lines))
+    print(compile_blocks(csharp_compiler))
+
+def generate_python():
+    print(compile_blocks(python_compiler))
+
+# 저장 / 불러오기
+def workspace_records():
+    return {b["json"]["라벨"]: {"json": b["json"], "x": b["x"], "y": b["y"], "w": b["w"], "h": b["h"]}
+            for b in sorted(blocks.values(), key=lambda b: b["order"])}
+
+def clear_blocks():
+    canvas.delete("block")
+    blocks.clear()
+    grid.cells.clear()
+    drawn.clear()
+
+def save_file():
+    path = filedialog.asksaveasfilename(defaultextension=".bws",
+                                        filetypes=[("블록 작업공간", "*.bws"), ("JSON", "*.json")])
+    if path:
+        save_workspace(path, workspace_records())
+
+def load_file():
+    global load_generation
+    path = filedialog.askopenfilename(filetypes=[("블록 작업공간", "*.bws *.json")])
+    if not path:
+        return
+    try:
+        workspace = load_workspace(path)
+    except (OSError, ValueError) as e:
+        messagebox.showerror("불러오기 실패", str(e))
+        return
+    load_generation += 1
+    clear_blocks()
+    store.replace_all(workspace)
+    stream_blocks(list(workspace.values()))
+
+def on_close():
+    store.close()  # 남은 변경을 저널에 쓰고 스냅샷으로 합친다
+    root.destroy()
+
+root.protocol("WM_DELETE_WINDOW", on_close)
 
 # 버튼
+file_frame = tk.Frame(root)
+file_frame.pack(pady=5)
+tk.Button(file_frame, text="작업공간 저장", command=save_file).pack(side=tk.LEFT, padx=5)
+tk.Button(file_frame, text="작업공간 불러오기", command=load_file).pack(side=tk.LEFT, padx=5)
+
 btn_generate = tk.Button(root, text="C# 코드 생성", command=generate_csharp)
 btn_generate.pack(pady=5)
+btn_generate_py = tk.Button(root, text="Python 코드 생성", command=generate_python)
+btn_generate_py.pack(pady=5)
 
 root.mainloop()
@@ -0,0 +1,40 @@
+# =======================
+# 기하 연산 패키지 (vector3d_algo.py / vector_utils.py / yuih.py 통합)
+# =======================
+# 하위 모듈은 처음 쓰는 이름에 맞춰 그때 불러온다 (PEP 562).
+# NumPy는 배열 연산 모듈을 처음 건드릴 때만 로드되므로,
+# math만 쓰는 짧은 스크립트는 NumPy import 시간을 내지 않는다.
+import importlib
+
+_SUBMODULES = {
+    # NumPy 없이 math만 쓰는 연산
+    "ceil": "basic", "floor": "basic", "sqrt": "basic", "minimum": "basic", "maximum": "basic",
+    "vector_to_angles": "basic", "aabb_intersect": "basic",
+    # 벡터 (NumPy)
+    "normalize": "vectors", "dot": "vectors", "cross": "vectors", "distance": "vectors",
+    "matmul": "vectors", "angle_between_vectors": "vectors",
+    # 교점 (NumPy)
+    "point_plane_distance": "intersect", "line_plane_intersection": "intersect",
+    "ray_triangle_intersection": "intersect",
+    # 회전 (NumPy)
+    "rotation_matrix": "rotation", "quaternion_multiply": "rotation", "quaternion_rotate_vector": "rotation",
+    # 투영 행렬 (NumPy)
+    "perspective": "projection", "orthographic": "projection",
+    # 충돌 박스 (NumPy)
+    "point_in_aabb": "collision", "point_in_obb": "collision",
+}
+
+__all__ = sorted(_SUBMODULES)
+
+def __getattr__(name):
+    module_name = _SUBMODULES.get(name)
+    if module_name is None:
+        if name in set(_SUBMODULES.values()):
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # 다음부터는 __getattr__를 거치지 않는다
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -0,0 +1,26 @@
+import math
+
+# NumPy 없이 math만 쓰는 연산
+
+# 올림, 내림, 제곱근
+def ceil(x): return math.ceil(x)
+def floor(x): return math.floor(x)
+def sqrt(x): return math.sqrt(x)
+
+# min, max (리스트나 튜플 입력)
+def minimum(values): return min(values)
+def maximum(values): return max(values)
+
+def vector_to_angles(v):
+    """방향 벡터를 yaw(pan), pitch(tilt) 각도로 변환"""
+    x, y, z = v
+    yaw = math.atan2(z, x)
+    pitch = math.atan2(y, math.sqrt(x**2 + z**2))
+    return yaw, pitch
+
+def aabb_intersect(min1, max1, min2, max2):
+    """AABB 충돌 체크"""
+    for i in range(3):
+        if max1[i] < min2[i] or min1[i] > max2[i]:
+            return False
+    return True
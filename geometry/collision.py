@@ -0,0 +1,21 @@
+import numpy as np
+
+# 충돌 박스 (AABB, OBB). AABB끼리의 충돌은 basic.aabb_intersect
+
+def point_in_aabb(p, min_corner, max_corner):
+    p = np.array(p)
+    return np.all(p >= min_corner) and np.all(p <= max_corner)
+
+# OBB 충돌은 회전 행렬 포함해야 하므로 조금 복잡
+def point_in_obb(p, center, axes, half_sizes):
+    """
+    p: 점
+    center: OBB 중심
+    axes: 3x3 직교 행렬 (local x,y,z axes)
+    half_sizes: 각 축 절반 길이
+    """
+    d = p - center
+    for i in range(3):
+        if abs(np.dot(d, axes[:,i])) > half_sizes[i]:
+            return False
+    return True
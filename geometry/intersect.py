@@ -0,0 +1,46 @@
+import numpy as np
+
+# 점/선/평면/삼각형 교점
+
+def point_plane_distance(p, plane_point, plane_normal):
+    """점 p와 평면(plane_point, plane_normal) 사이 거리"""
+    p, plane_point, plane_normal = map(np.array, (p, plane_point, plane_normal))
+    plane_normal = plane_normal / np.linalg.norm(plane_normal)
+    return np.dot(p - plane_point, plane_normal)
+
+def line_plane_intersection(p0, p1, plane_point, plane_normal):
+    """선분 p0->p1과 평면 교점, 없으면 None"""
+    p0, p1, plane_point, plane_normal = map(np.array, (p0, p1, plane_point, plane_normal))
+    plane_normal = plane_normal / np.linalg.norm(plane_normal)
+    u = p1 - p0
+    denom = np.dot(plane_normal, u)
+    if abs(denom) < 1e-6:  # 평행
+        return None
+    t = np.dot(plane_normal, plane_point - p0) / denom
+    if 0 <= t <= 1:
+        return p0 + t * u
+    return None
+
+def ray_triangle_intersection(ray_origin, ray_dir, tri):
+    """Möller–Trumbore 알고리즘"""
+    epsilon = 1e-6
+    vertex0, vertex1, vertex2 = map(np.array, tri)
+    edge1 = vertex1 - vertex0
+    edge2 = vertex2 - vertex0
+    h = np.cross(ray_dir, edge2)
+    a = np.dot(edge1, h)
+    if abs(a) < epsilon:
+        return None
+    f = 1.0 / a
+    s = ray_origin - vertex0
+    u = f * np.dot(s, h)
+    if u < 0.0 or u > 1.0:
+        return None
+    q = np.cross(s, edge1)
+    v = f * np.dot(ray_dir, q)
+    if v < 0.0 or u + v > 1.0:
+        return None
+    t = f * np.dot(edge2, q)
+    if t > epsilon:
+        return ray_origin + ray_dir * t
+    return None
@@ -0,0 +1,27 @@
+import math
+import numpy as np
+
+# 투영 행렬 (카메라)
+
+def perspective(fov, aspect, near, far):
+    """원근 투영 행렬"""
+    f = 1.0 / math.tan(fov/2)
+    mat = np.zeros((4,4))
+    mat[0,0] = f / aspect
+    mat[1,1] = f
+    mat[2,2] = (far+near)/(near-far)
+    mat[2,3] = (2*far*near)/(near-far)
+    mat[3,2] = -1
+    return mat
+
+def orthographic(left, right, bottom, top, near, far):
+    """정투영 행렬"""
+    mat = np.zeros((4,4))
+    mat[0,0] = 2/(right-left)
+    mat[1,1] = 2/(top-bottom)
+    mat[2,2] = -2/(far-near)
+    mat[0,3] = -(right+left)/(right-left)
+    mat[1,3] = -(top+bottom)/(top-bottom)
+    mat[2,3] = -(far+near)/(far-near)
+    mat[3,3] = 1
+    return mat
@@ -0,0 +1,32 @@
+import math
+import numpy as np
+
+# 회전 (행렬, 쿼터니언)
+
+def rotation_matrix(axis, theta):
+    """axis='x','y','z', theta in radians"""
+    c, s = math.cos(theta), math.sin(theta)
+    if axis == 'x':
+        return np.array([[1,0,0],[0,c,-s],[0,s,c]])
+    elif axis == 'y':
+        return np.array([[c,0,s],[0,1,0],[-s,0,c]])
+    elif axis == 'z':
+        return np.array([[c,-s,0],[s,c,0],[0,0,1]])
+    else:
+        raise ValueError("Axis must be 'x','y','z'")
+
+def quaternion_multiply(q1, q2):
+    """q = [w, x, y, z]"""
+    w1,x1,y1,z1 = q1
+    w2,x2,y2,z2 = q2
+    w = w1*w2 - x1*x2 - y1*y2 - z1*z2
+    x = w1*x2 + x1*w2 + y1*z2 - z1*y2
+    y = w1*y2 - x1*z2 + y1*w2 + z1*x2
+    z = w1*z2 + x1*y2 - y1*x2 + z1*w2
+    return np.array([w,x,y,z])
+
+def quaternion_rotate_vector(q, v):
+    """벡터 v를 쿼터니언 q로 회전"""
+    q_conj = np.array([q[0], -q[1], -q[2], -q[3]])
+    v_quat = np.array([0]+list(v))
+    return quaternion_multiply(quaternion_multiply(q, v_quat), q_conj)[1:]
@@ -3,142 +3,21 @@ import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 import requests
-import base64
 import threading
-import urllib.parse
 import re
 
-# =======================
-# 환경변수에서 토큰과 사용자 이름 불러오기
-# =======================
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-GITHUB_USER = os.getenv("GITHUB_USER")
-
-if not GITHUB_TOKEN or not GITHUB_USER:
-    raise ValueError("환경변수 GITHUB_TOKEN 또는 GITHUB_USER가 설정되지 않았습니다.")
+from github_upload import (
+    STATS, build_tree_index, create_github_folder, get_branch_head, get_github_contents, get_repo_tree,
+    get_repos, is_private_repo, require_credentials, upload_files, upload_folder,
+)
 
-# =======================
-# GitHub API 관련
-# =======================
-def get_repos(filter_option="all"):
-    url = "https://api.github.com/user/repos?per_page=100"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    resp = requests.get(url, headers=headers)
-    if resp.status_code == 200:
-        repos = resp.json()
-        if filter_option == "public":
-            return [repo['name'] for repo in repos if not repo['private']]
-        elif filter_option == "private":
-            return [repo['name'] for repo in repos if repo['private']]
-        else:
-            return [repo['name'] for repo in repos]
-    else:
-        messagebox.showerror("Error", f"Failed to fetch repos: {resp.status_code}")
-        return []
-
-def is_private_repo(repo_name):
-    url = f"https://api.github.com/repos/{GITHUB_USER}/{repo_name}"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    resp = requests.get(url, headers=headers)
-    if resp.status_code == 200:
-        return resp.json().get("private", False)
-    return False
-
-def encode_github_path(path):
-    return "/".join([urllib.parse.quote(p, safe='') for p in path.split("/")])
-
-def get_github_contents(repo_name, path=""):
-    url = f"https://api.github.com/repos/{GITHUB_USER}/{repo_name}/contents/{encode_github_path(path)}"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    resp = requests.get(url, headers=headers)
-    if resp.status_code == 200:
-        return resp.json()
-    return []
-
-def make_unique_name(repo_name, path):
-    path = path.replace("\\", "/")
-    base, ext = os.path.splitext(path)
-    counter = 1
-    new_path = path
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    while True:
-        url = f"https://api.github.com/repos/{GITHUB_USER}/{repo_name}/contents/{encode_github_path(new_path)}"
-        resp = requests.get(url, headers=headers)
-        if resp.status_code == 404:
-            break
-        counter += 1
-        new_path = f"{base}_{counter}{ext}"
-    return new_path
-
-def create_github_folder(repo_name, folder_path):
-    if not folder_path:
-        return False
-    url = f"https://api.github.com/repos/{GITHUB_USER}/{repo_name}/contents/{encode_github_path(folder_path)}/.gitkeep"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    data = {"message": f"Create folder {folder_path}", "content": ""}
-    resp = requests.put(url, headers=headers, json=data)
-    return resp.status_code in [200, 201]
-
-def ensure_github_folder(repo_name, folder_path):
-    if not folder_path:
-        return
-    items = get_github_contents(repo_name, folder_path)
-    if not items:
-        create_github_folder(repo_name, folder_path)
-
-# =======================
-# 파일 업로드
-# =======================
-def get_relative_path(file_path, base_path=None):
-    try:
-        if base_path:
-            return os.path.relpath(file_path, base_path)
-        else:
-            return os.path.basename(file_path)
-    except ValueError:
-        return os.path.basename(file_path)
-
-def upload_file(repo_name, file_path, github_root="", local_base_path=None,
-                progress_label=None, progress_bar=None, index=None, total=None, stop_event=None):
-    if stop_event and stop_event.is_set():
-        return
-    rel_path_local = get_relative_path(file_path, local_base_path)
-    rel_path = os.path.join(github_root, rel_path_local).replace("\\", "/") if github_root else rel_path_local.replace("\\", "/")
-    folder_only = os.path.dirname(rel_path)
-    if folder_only:
-        ensure_github_folder(repo_name, folder_only)
-    rel_path_unique = make_unique_name(repo_name, rel_path)
-    url = f"https://api.github.com/repos/{GITHUB_USER}/{repo_name}/contents/{encode_github_path(rel_path_unique)}"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    with open(file_path, "rb") as f:
-        content = base64.b64encode(f.read()).decode()
-    data = {"message": f"Add {rel_path_unique}", "content": content}
-    resp = requests.put(url, headers=headers, json=data)
-    if resp.status_code not in [200, 201]:
-        print(f"Failed: {rel_path_unique} ({resp.status_code})")
-    if progress_label and index is not None and total is not None:
-        progress_label.after(0, lambda: progress_label.config(text=f"Uploading: {rel_path_unique} ({index}/{total})"))
-    if progress_bar and index is not None and total is not None:
-        progress_bar.after(0, lambda: progress_bar.config(value=(index / total) * 100))
-
-def upload_folder(repo_name, folder_path, github_root="", progress_label=None, progress_bar=None, stop_event=None, start_index=1, local_base_path=None):
-    files_list = []
-    for root, dirs, files in os.walk(folder_path):
-        for file in files:
-            files_list.append(os.path.join(root, file))
-    total_files = len(files_list)
-    local_base = local_base_path if local_base_path else os.path.dirname(folder_path)
-    for idx, file_path in enumerate(files_list, start=start_index):
-        if stop_event and stop_event.is_set():
-            break
-        upload_file(repo_name, file_path, github_root=github_root, local_base_path=local_base,
-                    progress_label=progress_label, progress_bar=progress_bar, index=idx, total=total_files+start_index-1,
-                    stop_event=stop_event)
-    return total_files
+require_credentials()
 
 # =======================
 # GUI
 # =======================
+TREE_INSERT_CHUNK = 200  # 한 번의 idle 콜백에서 Treeview에 넣는 항목 수
+
 class GitHubDnDUploader(TkinterDnD.Tk):
     def __init__(self):
         super().__init__()
@@ -146,12 +25,13 @@ class GitHubDnDUploader(TkinterDnD.Tk):
         self.geometry("600x850")
         self.stop_event = None
         self.upload_thread = None
+        self.tree_index = None
+        self.tree_index_repo = None
 
         tk.Label(self, text="Select GitHub Repo:").pack()
         self.repo_listbox = tk.Listbox(self)
         self.repo_listbox.pack(fill=tk.BOTH, expand=False)
         self.repo_listbox.bind("<<ListboxSelect>>", self.refresh_tree)
-        self.refresh_repo_list()
 
         frame = tk.Frame(self)
         frame.pack(fill=tk.X)
@@ -167,6 +47,8 @@ class GitHubDnDUploader(TkinterDnD.Tk):
         self.progress_label.pack(pady=5)
         self.progress_bar = ttk.Progressbar(self, orient="horizontal", length=550, mode="determinate")
         self.progress_bar.pack(pady=5)
+        self.stats_label = tk.Label(self, text="", fg="gray")
+        self.stats_label.pack()
         self.cancel_button = tk.Button(self, text="Cancel Upload", command=self.cancel_upload)
         self.cancel_button.pack(pady=5)
 
@@ -176,19 +58,65 @@ class GitHubDnDUploader(TkinterDnD.Tk):
         self.drop_area.drop_target_register(DND_FILES)
         self.drop_area.dnd_bind('<<Drop>>', self.handle_drop)
 
+        # 저장소 목록은 창이 뜬 뒤 백그라운드에서 불러온다
+        self.after(0, self.refresh_repo_list)
+
     # =======================
     # GUI 함수
     # =======================
     def refresh_repo_list(self):
         self.repo_listbox.delete(0, tk.END)
-        repos = get_repos()
+        self.progress_label.config(text="Loading repositories...")
+        threading.Thread(target=self.load_repos, daemon=True).start()
+
+    def load_repos(self):
+        try:
+            repos = get_repos()
+        except (RuntimeError, requests.RequestException) as e:
+            error = str(e)
+            self.after(0, lambda: self.progress_label.config(text=""))
+            self.after(0, lambda: messagebox.showerror("Error", error))
+            return
+        self.after(0, lambda: self.show_repos(repos))
+
+    def show_repos(self, repos):
+        self.repo_listbox.delete(0, tk.END)
         for repo in repos:
             self.repo_listbox.insert(tk.END, repo)
+        self.progress_label.config(text="")
 
     def refresh_tree(self, event=None):
         self.tree.delete(*self.tree.get_children())
         root_node = self.tree.insert("", "end", text="메인(루트)", values=("", "dir"))
         self.add_dummy_children(root_node)
+        self.prefetch_tree()
+
+    # 저장소 전체 트리를 미리 받아 두면 폴더를 펼칠 때 API를 기다리지 않는다
+    def prefetch_tree(self):
+        self.tree_index = None
+        selection = self.repo_listbox.curselection()
+        if not selection:
+            self.tree_index_repo = None
+            return
+        repo_name = self.repo_listbox.get(selection[0])
+        self.tree_index_repo = repo_name
+        threading.Thread(target=self.load_tree_index, args=(repo_name,), daemon=True).start()
+
+    def load_tree_index(self, repo_name):
+        try:
+            head = get_branch_head(repo_name)
+            tree = get_repo_tree(repo_name, head[2]) if head else None
+        except requests.RequestException:
+            return
+        if tree is None:
+            return
+        index = build_tree_index(tree)
+        self.after(0, lambda: self.set_tree_index(repo_name, index))
+
+    def set_tree_index(self, repo_name, index):
+        # 그 사이 다른 저장소를 골랐다면 버린다
+        if repo_name == self.tree_index_repo:
+            self.tree_index = index
 
     def add_dummy_children(self, node):
         self.tree.insert(node, "end", text="dummy")
@@ -202,16 +130,39 @@ class GitHubDnDUploader(TkinterDnD.Tk):
             selection = self.repo_listbox.curselection()
             if selection:
                 repo_name = self.repo_listbox.get(selection[0])
-                self.build_tree(node, repo_name, path)
+                if self.tree_index is not None and self.tree_index_repo == repo_name:
+                    self.insert_items(node, self.tree_index.get(path, []))
+                else:
+                    self.build_tree(node, repo_name, path)
 
     def build_tree(self, parent, repo_name, path=""):
-        items = get_github_contents(repo_name, path)
-        for item in items:
+        # 전체 트리를 아직 못 받았으면 이 폴더만 백그라운드에서 받아 온다
+        placeholder = self.tree.insert(parent, "end", text="Loading...")
+        threading.Thread(target=self.load_contents, args=(parent, placeholder, repo_name, path), daemon=True).start()
+
+    def load_contents(self, parent, placeholder, repo_name, path):
+        try:
+            items = get_github_contents(repo_name, path)
+        except requests.RequestException:
+            items = []
+        self.after(0, lambda: self.show_contents(parent, placeholder, items))
+
+    def show_contents(self, parent, placeholder, items):
+        if self.tree.exists(placeholder):
+            self.tree.delete(placeholder)
+        self.insert_items(parent, items)
+
+    def insert_items(self, parent, items, start=0):
+        # 항목이 수천 개인 폴더도 메인 루프가 멈추지 않도록 나눠서 넣는다
+        if not self.tree.exists(parent):
+            return
+        end = start + TREE_INSERT_CHUNK
+        for item in items[start:end]:
+            node = self.tree.insert(parent, "end", text=item["name"], values=(item["path"], item["type"]))
             if item["type"] == "dir":
-                node = self.tree.insert(parent, "end", text=item["name"], values=(item["path"], item["type"]))
                 self.add_dummy_children(node)
-            else:
-                self.tree.insert(parent, "end", text=item["name"], values=(item["path"], item["type"]))
+        if end < len(items):
+            self.after_idle(lambda: self.insert_items(parent, items, end))
 
     def new_folder(self):
         repo_selection = self.repo_listbox.curselection()
@@ -275,23 +226,31 @@ class GitHubDnDUploader(TkinterDnD.Tk):
             messagebox.showwarning("Warning", "No valid files or folders detected!")
             return
 
+        total_bytes = sum(os.path.getsize(p) for p in files_to_upload)
+        for folder_path in folders_to_upload:
+            for root, dirs, files in os.walk(folder_path):
+                total_bytes += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+        STATS.begin_batch(total_bytes)
+
         self.stop_event = threading.Event()
         self.upload_thread = threading.Thread(
             target=self.upload_paths,
             args=(repo_name, files_to_upload, folders_to_upload, github_root)
         )
         self.upload_thread.start()
+        self.update_stats_label()
+
+    def update_stats_label(self):
+        self.stats_label.config(text=STATS.progress_text())
+        if self.upload_thread and self.upload_thread.is_alive():
+            self.after(500, self.update_stats_label)
 
     def upload_paths(self, repo_name, files, folders, github_root):
-        current_index = 0
-        total_files = len(files)
-        for idx, file_path in enumerate(files, start=1):
-            if self.stop_event.is_set():
-                break
-            upload_file(repo_name, file_path, github_root, local_base_path=None,
-                        progress_label=self.progress_label, progress_bar=self.progress_bar,
-                        index=idx, total=total_files, stop_event=self.stop_event)
-            current_index += 1
+        known_blobs = set()  # 한 번의 드롭 안에서 같은 내용은 한 번만 업로드
+        # 폴더 밖 파일들도 커밋 하나로 올리고 폴더와 known_blobs를 같이 쓴다
+        current_index = upload_files(repo_name, files, github_root,
+                                     progress_label=self.progress_label, progress_bar=self.progress_bar,
+                                     stop_event=self.stop_event, known_blobs=known_blobs)
 
         for folder_path in folders:
             if self.stop_event.is_set():
@@ -299,9 +258,10 @@ class GitHubDnDUploader(TkinterDnD.Tk):
             uploaded_count = upload_folder(repo_name, folder_path, github_root,
                                            progress_label=self.progress_label, progress_bar=self.progress_bar,
                                            stop_event=self.stop_event, start_index=current_index+1,
-                                           local_base_path=None)
+                                           local_base_path=None, known_blobs=known_blobs)
             current_index += uploaded_count
 
+        print(STATS.summary())
         if not self.stop_event.is_set():
             self.refresh_tree()
             self.progress_label.config(text="Upload Complete")
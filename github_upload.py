@@ -0,0 +1,773 @@
+import os
+import requests
+import base64
+import hashlib
+import json
+import math
+import threading
+import urllib.parse
+import time
+import email.utils
+from concurrent.futures import ThreadPoolExecutor
+
+from atomic_file import write_atomic
+
+# =======================
+# 환경변수에서 토큰과 사용자 이름 불러오기
+# =======================
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GITHUB_USER = os.getenv("GITHUB_USER")
+GITHUB_API = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")  # 테스트 서버로 바꿀 때만 설정
+
+def require_credentials():
+    # import 시점이 아니라 실제로 API를 쓰기 직전에 확인한다 (Tk 없는 스크립트에서도 import 가능)
+    if not GITHUB_TOKEN or not GITHUB_USER:
+        raise ValueError("환경변수 GITHUB_TOKEN 또는 GITHUB_USER가 설정되지 않았습니다.")
+
+# =======================
+# API 호출 계측 (지연 시간, 전송량, 재시도, rate limit)
+# =======================
+LOG_DIR = os.path.join(os.path.expanduser("~"), ".cache", "github_dnd_uploader", "logs")
+MAX_RETRIES = 3
+RETRY_MAX_WAIT = 60  # 이보다 오래 기다려야 하는 rate limit은 재시도하지 않음
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    # nearest-rank 방식
+    rank = math.ceil(p / 100 * len(sorted_values))
+    return sorted_values[max(0, min(rank, len(sorted_values)) - 1)]
+
+class ApiStats:
+    """요청마다 한 줄씩 JSON-lines 로그를 남기고, 업로드 속도와 요약 통계를 계산한다."""
+    def __init__(self, log_dir=LOG_DIR):
+        self.lock = threading.Lock()
+        self.log_dir = log_dir
+        self.log_file = None
+        self.records = []
+        self.rate_limit = None  # (남은 요청 수, 한도, 초기화 시각)
+        self.batch_start = 0
+        self.batch_started_at = time.time()
+        self.batch_total_bytes = 0
+        self.batch_done_bytes = 0
+        self.batch_failed = 0  # 올리지 못한(실패하거나 건너뛴) 파일 수
+
+    def write_log(self, entry):
+        if self.log_file is None:
+            try:
+                os.makedirs(self.log_dir, exist_ok=True)
+                name = time.strftime("session-%Y%m%d-%H%M%S.jsonl")
+                self.log_file = open(os.path.join(self.log_dir, name), "a", encoding="utf-8")
+            except OSError:
+                return
+        self.log_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.log_file.flush()
+
+    def record(self, entry):
+        with self.lock:
+            self.records.append(entry)
+            if entry.get("rate_remaining") is not None:
+                self.rate_limit = (entry["rate_remaining"], entry["rate_limit"], entry["rate_reset"])
+            self.write_log(entry)
+
+    def begin_batch(self, total_bytes):
+        with self.lock:
+            self.batch_start = len(self.records)
+            self.batch_started_at = time.time()
+            self.batch_total_bytes = total_bytes
+            self.batch_done_bytes = 0
+            self.batch_failed = 0
+
+    def add_failure(self, count=1):
+        with self.lock:
+            self.batch_failed += count
+
+    def add_progress(self, nbytes):
+        with self.lock:
+            self.batch_done_bytes += nbytes
+
+    def progress_text(self):
+        with self.lock:
+            elapsed = max(time.time() - self.batch_started_at, 1e-6)
+            speed = self.batch_done_bytes / elapsed
+            remaining = max(self.batch_total_bytes - self.batch_done_bytes, 0)
+            rate_limit = self.rate_limit
+        text = f"{speed / (1024 * 1024):.2f} MB/s"
+        if speed > 0:
+            eta = int(remaining / speed)
+            text += f", ETA {eta // 60}:{eta % 60:02d}"
+        if rate_limit:
+            text += f", API {rate_limit[0]}/{rate_limit[1]}"
+        return text
+
+    def summary(self):
+        with self.lock:
+            records = self.records[self.batch_start:]
+            elapsed = time.time() - self.batch_started_at
+            done_bytes = self.batch_done_bytes
+            failed = self.batch_failed
+        by_endpoint = {}
+        for r in records:
+            by_endpoint.setdefault(r["endpoint"], []).append(r)
+        lines = [f"{len(records)} requests, {done_bytes / (1024 * 1024):.2f} MB in {elapsed:.1f}s "
+                 f"({done_bytes / (1024 * 1024) / max(elapsed, 1e-6):.2f} MB/s)"]
+        if failed:
+            lines.append(f"  {failed} files not uploaded")
+        # 전체 시간을 가장 많이 쓴 엔드포인트부터
+        for endpoint, rs in sorted(by_endpoint.items(), key=lambda kv: -sum(r["latency"] for r in kv[1])):
+            latencies = sorted(r["latency"] * 1000 for r in rs)
+            lines.append(
+                f"  {endpoint:<22} n={len(rs):<5} "
+                f"p50={percentile(latencies, 50):.0f}ms p95={percentile(latencies, 95):.0f}ms "
+                f"p99={percentile(latencies, 99):.0f}ms "
+                f"total={sum(latencies) / 1000:.1f}s sent={sum(r['bytes_sent'] for r in rs)} "
+                f"retries={sum(r['retries'] for r in rs)}")
+        if self.rate_limit:
+            lines.append(f"  rate limit remaining: {self.rate_limit[0]}/{self.rate_limit[1]}")
+        return "\n".join(lines)
+
+STATS = ApiStats()
+
+def endpoint_name(method, url):
+    parts = urllib.parse.urlparse(url).path.strip("/").split("/")
+    if parts[0] == "repos" and len(parts) >= 3:
+        rest = parts[3:]
+        if not rest:
+            name = "repos/{repo}"
+        elif rest[0] == "git" and len(rest) > 1:
+            name = f"git/{rest[1]}"
+        else:
+            name = rest[0]
+    else:
+        name = "/".join(parts[:2])
+    return f"{method} {name}"
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 기다릴 초로. 알아볼 수 없으면 None"""
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        return None
+    return max(int(when.timestamp() - time.time()), 0)
+
+def retry_delay(resp, attempt):
+    """재시도해야 하면 기다릴 초, 아니면 None"""
+    if resp is None or resp.status_code >= 500:
+        return 2 ** attempt
+    if resp.status_code in (403, 429):
+        if resp.headers.get("Retry-After"):
+            return parse_retry_after(resp.headers["Retry-After"])
+        if resp.headers.get("X-RateLimit-Remaining") == "0":
+            return max(int(resp.headers.get("X-RateLimit-Reset", "0")) - int(time.time()), 1)
+    return None
+
+def api_request(method, url, **kwargs):
+    """requests.request와 같지만 지연 시간/전송량/rate limit을 STATS에 기록하고 일시적 오류는 재시도한다"""
+    retries = 0
+    started = time.time()
+    while True:
+        attempt_started = time.time()
+        error = None
+        try:
+            resp = requests.request(method, url, **kwargs)
+        except requests.ConnectionError as e:
+            resp, error = None, e
+        delay = retry_delay(resp, retries)
+        if delay is None or delay > RETRY_MAX_WAIT or retries >= MAX_RETRIES:
+            break
+        retries += 1
+        time.sleep(delay)
+    entry = {
+        "time": started,
+        "endpoint": endpoint_name(method, url),
+        "url": url,
+        "status": resp.status_code if resp is not None else None,
+        "latency": time.time() - attempt_started,
+        "elapsed": time.time() - started,
+        "bytes_sent": int(resp.request.headers.get("Content-Length", 0)) if resp is not None else 0,
+        "bytes_received": len(resp.content) if resp is not None else 0,
+        "retries": retries,
+        "rate_remaining": None,
+        "rate_limit": None,
+        "rate_reset": None,
+    }
+    if resp is not None and "X-RateLimit-Remaining" in resp.headers:
+        entry["rate_remaining"] = int(resp.headers["X-RateLimit-Remaining"])
+        entry["rate_limit"] = int(resp.headers.get("X-RateLimit-Limit", 0))
+        entry["rate_reset"] = int(resp.headers.get("X-RateLimit-Reset", 0))
+    STATS.record(entry)
+    if error is not None:
+        raise error
+    return resp
+
+# =======================
+# 조건부 요청 캐시 (ETag / Last-Modified)
+# =======================
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "github_dnd_uploader")
+CACHE_MAX_BYTES = 64 * 1024 * 1024   # 넘으면 오래 안 쓴 항목부터 지운다
+CACHE_MAX_AGE = 30 * 24 * 3600       # 이보다 오래 안 쓴 항목은 지운다
+CACHE_IMMUTABLE_MAX_AGE = 24 * 3600  # SHA로 찾은 트리는 브랜치가 움직이면 다시 안 쓰므로 짧게
+REPO_PAGE_WORKERS = 4
+
+_cache_lock = threading.Lock()
+_cache_written = None  # 마지막 정리 후 쓴 바이트 수 (None이면 이번 프로세스에서 아직 정리 안 함)
+
+def _cache_file(url, immutable=False):
+    # 토큰이 다르면 다른 계정의 응답이므로 키에 함께 넣는다
+    key = hashlib.sha1(f"{GITHUB_TOKEN}\n{url}".encode()).hexdigest()
+    # 바뀌지 않는 응답은 이름으로 구분해 두고 정리할 때 먼저 지운다
+    prefix = "i-" if immutable else ""
+    return os.path.join(CACHE_DIR, f"{prefix}{key}.json")
+
+def prune_cache():
+    """나이 제한을 넘은 항목을 지우고, 전체 크기가 CACHE_MAX_BYTES 이하가 될 때까지
+    바뀌지 않는 항목 → 오래 안 쓴 항목 순으로 지운다. 쓰이는 시각은 mtime으로 기록한다."""
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    now = time.time()
+    entries = []
+    total = 0
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        immutable = name.startswith("i-")
+        max_age = CACHE_IMMUTABLE_MAX_AGE if immutable else CACHE_MAX_AGE
+        if now - st.st_mtime > max_age:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        entries.append((not immutable, st.st_mtime, st.st_size, path))
+        total += st.st_size
+    entries.sort()
+    for _, _, size, path in entries:
+        if total <= CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def _note_cache_write(size):
+    # 프로세스마다 처음 한 번, 그 뒤로는 한도의 1/4만큼 쓸 때마다 정리
+    global _cache_written
+    with _cache_lock:
+        if _cache_written is not None and _cache_written + size < CACHE_MAX_BYTES // 4:
+            _cache_written += size
+            return
+        _cache_written = 0
+    prune_cache()
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+def cached_get(url, headers, immutable=False):
+    """조건부 GET. 304면 디스크에 저장된 본문을 돌려준다.
+
+    반환값은 (상태 코드, JSON 본문, Link 헤더). GitHub는 304 응답을
+    rate limit에 포함하지 않으므로 다시 열 때마다 드는 비용이 거의 없다.
+    immutable이면 (SHA로 찾는 트리처럼 내용이 바뀌지 않는 URL) 캐시가 있을 때 요청하지 않는다.
+    """
+    cache_path = _cache_file(url, immutable)
+    cached = None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        pass
+    if cached and immutable:
+        _touch(cache_path)
+        return 200, cached["body"], cached.get("link", "")
+    request_headers = dict(headers)
+    if cached:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+    resp = api_request("GET", url, headers=request_headers)
+    if resp.status_code == 304 and cached:
+        _touch(cache_path)
+        return 200, cached["body"], cached.get("link", "")
+    if resp.status_code != 200:
+        return resp.status_code, None, ""
+    body = resp.json()
+    entry = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "link": resp.headers.get("Link", ""),
+        "body": body,
+    }
+    if immutable or entry["etag"] or entry["last_modified"]:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            write_atomic(cache_path, json.dumps(entry))
+            _note_cache_write(os.path.getsize(cache_path))
+        except OSError:
+            pass
+    return 200, body, entry["link"]
+
+# =======================
+# GitHub API 관련
+# =======================
+def get_last_page(link_header):
+    for link in requests.utils.parse_header_links(link_header):
+        if link.get("rel") == "last":
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(link["url"]).query)
+            return int(query.get("page", ["1"])[0])
+    return 1
+
+def get_repos(filter_option="all"):
+    url = f"{GITHUB_API}/user/repos?per_page=100"
+    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+    status, repos, link = cached_get(url, headers)
+    if status != 200:
+        raise RuntimeError(f"Failed to fetch repos: {status}")
+    last_page = get_last_page(link)
+    if last_page > 1:
+        # 첫 페이지의 Link 헤더로 전체 페이지 수를 알았으니 나머지는 병렬로 받는다
+        page_urls = [f"{url}&page={page}" for page in range(2, last_page + 1)]
+        with ThreadPoolExecutor(max_workers=REPO_PAGE_WORKERS) as executor:
+            for status, page_repos, _ in executor.map(lambda u: cached_get(u, headers), page_urls):
+                if status != 200:
+                    raise RuntimeError(f"Failed to fetch repos: {status}")
+                repos.extend(page_repos)
+    if filter_option == "public":
+        return [repo['name'] for repo in repos if not repo['private']]
+    elif filter_option == "private":
+        return [repo['name'] for repo in repos if repo['private']]
+    else:
+        return [repo['name'] for repo in repos]
+
+def is_private_repo(repo_name):
+    url = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}"
+    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+    resp = api_request("GET", url, headers=headers)
+    if resp.status_code == 200:
+        return resp.json().get("private", False)
+    return False
+
+def encode_github_path(path):
+    return "/".join([urllib.parse.quote(p, safe='') for p in path.split("/")])
+
+def get_github_contents(repo_name, path=""):
+    url = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}/contents/{encode_github_path(path)}"
+    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+    status, items, _ = cached_get(url, headers)
+    if status == 200:
+        return items
+    return []
+
+def make_unique_name(repo_name, path):
+    path = path.replace("\\", "/")
+    base, ext = os.path.splitext(path)
+    counter = 1
+    new_path = path
+    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+    while True:
+        url = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}/contents/{encode_github_path(new_path)}"
+        resp = api_request("GET", url, headers=headers)
+        # 200만 "이미 있음". 404는 빈 이름이고, 그 밖의 오류는 무한히 돌지 않고 업로드 쪽에서 실패로 알린다
+        if resp.status_code != 200:
+            break
+        counter += 1
+        new_path = f"{base}_{counter}{ext}"
+    return new_path
+
+def create_github_folder(repo_name, folder_path):
+    if not folder_path:
+        return False
+    url = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}/contents/{encode_github_path(folder_path)}/.gitkeep"
+    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+    data = {"message": f"Create folder {folder_path}", "content": ""}
+    resp = api_request("PUT", url, headers=headers, json=data)
+    return resp.status_code in [200, 201]
+
+def ensure_github_folder(repo_name, folder_path):
+    if not folder_path:
+        return
+    items = get_github_contents(repo_name, folder_path)
+    if not items:
+        create_github_folder(repo_name, folder_path)
+
+# =======================
+# 스트리밍 업로드 (대용량 파일)
+# =======================
+GITHUB_FILE_SIZE_LIMIT = 100 * 1024 * 1024  # GitHub가 거부하는 파일 크기
+BLOB_UPLOAD_THRESHOLD = 10 * 1024 * 1024  # 이보다 큰 파일은 Git blobs API로 업로드
+STREAM_CHUNK_SIZE = 3 * 64 * 1024  # 3의 배수라야 청크 사이에 base64 패딩이 생기지 않음
+
+class Base64JSONBody:
+    """파일을 청크 단위로 base64 인코딩하면서 JSON 본문으로 흘려보낸다.
+
+    본문 길이를 미리 계산해 두므로 requests가 Content-Length를 붙여 보내고,
+    메모리에는 한 번에 청크 하나만 올라간다.
+    """
+    def __init__(self, file_path, fields, chunk_size=STREAM_CHUNK_SIZE):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(file_path)
+        head = json.dumps(fields)[:-1]
+        sep = ", " if fields else ""
+        self.prefix = f'{head}{sep}"content": "'.encode()
+        self.suffix = b'"}'
+        self.counted = 0  # 이 본문이 STATS 진행률에 더한 바이트 수
+
+    def count_progress(self, nbytes):
+        self.counted += nbytes
+        STATS.add_progress(nbytes)
+
+    def __len__(self):
+        return len(self.prefix) + 4 * ((self.size + 2) // 3) + len(self.suffix)
+
+    def __iter__(self):
+        # 재시도로 다시 보낼 때는 앞선 시도에서 더한 만큼 빼서 한 번만 세어지게 한다
+        if self.counted:
+            self.count_progress(-self.counted)
+        yield self.prefix
+        remaining = self.size
+        with open(self.file_path, "rb") as f:
+            while remaining > 0:
+                chunk = f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield base64.b64encode(chunk)
+                self.count_progress(len(chunk))
+        yield self.suffix
+
+def put_github_contents(repo_name, file_path, repo_path):
+    url = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}/contents/{encode_github_path(repo_path)}"
+    headers = {"Authorization": f"token {GITHUB_TOKEN}", "Content-Type": "application/json"}
+    body = Base64JSONBody(file_path, {"message": f"Add {repo_path}"})
+    resp = api_request("PUT", url, headers=headers, data=body)
+    return resp.status_code
+
+def get_branch_head(repo_name):
+    """기본 브랜치의 (이름, 커밋 SHA, 트리 SHA). 빈 저장소면 None"""
+    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+    base = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}"
+    resp = api_request("GET", base, headers=headers)
+    if resp.status_code != 200:
+        return None
+    branch = resp.json().get("default_branch", "main")
+    resp = api_request("GET", f"{base}/git/ref/heads/{urllib.parse.quote(branch)}", headers=headers)
+    if resp.status_code != 200:
+        return None
+    commit_sha = resp.json()["object"]["sha"]
+    resp = api_request("GET", f"{base}/git/commits/{commit_sha}", headers=headers)
+    if resp.status_code != 200:
+        return None
+    return branch, commit_sha, resp.json()["tree"]["sha"]
+
+def create_blob(repo_name, file_path):
+    """(blob SHA, HTTP 상태 코드). 실패하면 SHA는 None"""
+    url = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}/git/blobs"
+    headers = {"Authorization": f"token {GITHUB_TOKEN}", "Content-Type": "application/json"}
+    body = Base64JSONBody(file_path, {"encoding": "base64"})
+    resp = api_request("POST", url, headers=headers, data=body)
+    if resp.status_code != 201:
+        return None, resp.status_code
+    return resp.json()["sha"], resp.status_code
+
+def commit_tree_entries(repo_name, entries, message, head=None):
+    """entries: [(저장소 경로, blob SHA)] 를 기본 브랜치에 커밋 하나로 올린다 (SHA가 None이면 삭제)
+
+    반환값은 마지막 요청의 HTTP 상태 코드 (성공이면 200). 브랜치를 찾지 못하면 None
+    """
+    head = head or get_branch_head(repo_name)
+    if head is None:
+        return None
+    branch, commit_sha, tree_sha = head
+    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+    base = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}/git"
+    tree = [{"path": path, "mode": "100644", "type": "blob", "sha": sha} for path, sha in entries]
+    resp = api_request("POST", f"{base}/trees", headers=headers, json={"base_tree": tree_sha, "tree": tree})
+    if resp.status_code != 201:
+        return resp.status_code
+    new_tree = resp.json()["sha"]
+    resp = api_request("POST", f"{base}/commits", headers=headers,
+                       json={"message": message, "tree": new_tree, "parents": [commit_sha]})
+    if resp.status_code != 201:
+        return resp.status_code
+    new_commit = resp.json()["sha"]
+    resp = api_request("PATCH", f"{base}/refs/heads/{urllib.parse.quote(branch)}", headers=headers,
+                       json={"sha": new_commit})
+    return resp.status_code
+
+def upload_large_file(repo_name, file_path, repo_path):
+    """HTTP 상태 코드를 돌려준다 (성공이면 200 또는 201)"""
+    head = get_branch_head(repo_name)
+    if head is None:
+        # 빈 저장소는 Git 데이터 API를 쓸 수 없으므로 contents API로 스트리밍
+        return put_github_contents(repo_name, file_path, repo_path)
+    blob_sha, status = create_blob(repo_name, file_path)
+    if blob_sha is None:
+        return status
+    return commit_tree_entries(repo_name, [(repo_path, blob_sha)], f"Add {repo_path}", head=head)
+
+# =======================
+# 내용 해시 기반 중복 제거 업로드
+# =======================
+def git_blob_sha(file_path):
+    """git hash-object와 같은 blob SHA-1 (파일은 청크 단위로 읽음)"""
+    h = hashlib.sha1(f"blob {os.path.getsize(file_path)}\0".encode())
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def get_repo_tree(repo_name, tree_sha):
+    """저장소 전체 트리를 {경로: 항목}으로 반환. 실패하거나 잘린 응답이면 None"""
+    url = f"{GITHUB_API}/repos/{GITHUB_USER}/{repo_name}/git/trees/{tree_sha}?recursive=1"
+    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+    status, data, _ = cached_get(url, headers, immutable=True)
+    if status != 200:
+        return None
+    if data.get("truncated"):
+        return None
+    return {item["path"]: item for item in data["tree"]}
+
+def build_tree_index(tree):
+    """get_repo_tree 결과를 {폴더 경로: [자식 항목]} 으로 묶는다 (contents API와 같은 항목 형식)"""
+    kinds = {"tree": "dir", "blob": "file", "commit": "submodule"}
+    index = {"": []}
+    for path in sorted(tree):
+        kind = kinds.get(tree[path]["type"], "file")
+        parent, _, name = path.rpartition("/")
+        index.setdefault(parent, []).append({"name": name, "path": path, "type": kind})
+        if kind == "dir":
+            index.setdefault(path, [])
+    return index
+
+def upload_files_batch(repo_name, pairs, message, head=None, known_blobs=None,
+                       progress_label=None, progress_bar=None, start_index=1, total=None, stop_event=None,
+                       removed=()):
+    """[(로컬 경로, 저장소 경로)]를 커밋 하나로 올린다.
+
+    내용이 같은 파일은 blob SHA가 같으므로 blob을 한 번만 업로드하고,
+    저장소에 이미 있는 blob(known_blobs)은 아예 보내지 않는다.
+    removed에 있는 저장소 경로는 같은 커밋에서 삭제한다.
+    모든 파일이 커밋됐을 때만 True (일부 blob이 실패해도 나머지는 커밋한다).
+    """
+    head = head or get_branch_head(repo_name)
+    if head is None:
+        STATS.add_failure(len(pairs) + len(removed))
+        return False
+    if known_blobs is None:
+        known_blobs = set()
+    if total is None:
+        total = len(pairs) + start_index - 1
+    entries = []
+    failed = 0
+    for idx, (file_path, repo_path) in enumerate(pairs, start=start_index):
+        if stop_event and stop_event.is_set():
+            break
+        sha = git_blob_sha(file_path)
+        if sha not in known_blobs:
+            uploaded_sha, status = create_blob(repo_name, file_path)
+            if uploaded_sha != sha:
+                print(f"Failed: {repo_path} ({status})")
+                STATS.add_failure()
+                failed += 1
+                continue
+            known_blobs.add(sha)
+        else:
+            STATS.add_progress(os.path.getsize(file_path))
+        entries.append((repo_path, sha))
+        report_progress(f"Uploading: {repo_path}", progress_label, progress_bar, idx, total)
+    entries.extend((repo_path, None) for repo_path in removed)
+    if not entries:
+        return False
+    # 취소된 경우에도 이미 올라간 파일은 커밋해 둔다 (파일 단위 업로드와 같은 동작)
+    status = commit_tree_entries(repo_name, entries, message, head=head)
+    if status != 200:
+        print(f"Failed to commit: {message} ({status})")
+        STATS.add_failure(len(entries))
+    return status == 200 and not failed
+
+# =======================
+# 파일 업로드
+# =======================
+def get_relative_path(file_path, base_path=None):
+    try:
+        if base_path:
+            return os.path.relpath(file_path, base_path)
+        else:
+            return os.path.basename(file_path)
+    except ValueError:
+        return os.path.basename(file_path)
+
+def report_progress(text, progress_label=None, progress_bar=None, index=None, total=None):
+    if progress_label and index is not None and total is not None:
+        progress_label.after(0, lambda: progress_label.config(text=f"{text} ({index}/{total})"))
+    if progress_bar and index is not None and total is not None:
+        progress_bar.after(0, lambda: progress_bar.config(value=(index / total) * 100))
+
+def upload_file(repo_name, file_path, github_root="", local_base_path=None,
+                progress_label=None, progress_bar=None, index=None, total=None, stop_event=None):
+    if stop_event and stop_event.is_set():
+        return
+    rel_path_local = get_relative_path(file_path, local_base_path)
+    rel_path = os.path.join(github_root, rel_path_local).replace("\\", "/") if github_root else rel_path_local.replace("\\", "/")
+    # 크기 제한은 파일을 읽기 전에 확인
+    file_size = os.path.getsize(file_path)
+    if file_size > GITHUB_FILE_SIZE_LIMIT:
+        print(f"Skipped: {rel_path} ({file_size} bytes, GitHub limit {GITHUB_FILE_SIZE_LIMIT} bytes)")
+        STATS.add_failure()
+        STATS.add_progress(file_size)
+        report_progress(f"Skipped (too large): {rel_path}", progress_label, progress_bar, index, total)
+        return
+    folder_only = os.path.dirname(rel_path)
+    if folder_only and file_size <= BLOB_UPLOAD_THRESHOLD:
+        ensure_github_folder(repo_name, folder_only)
+    rel_path_unique = make_unique_name(repo_name, rel_path)
+    if file_size > BLOB_UPLOAD_THRESHOLD:
+        status = upload_large_file(repo_name, file_path, rel_path_unique)
+    else:
+        status = put_github_contents(repo_name, file_path, rel_path_unique)
+    if status not in [200, 201]:
+        print(f"Failed: {rel_path_unique} ({status})")
+        STATS.add_failure()
+    report_progress(f"Uploading: {rel_path_unique}", progress_label, progress_bar, index, total)
+
+def make_unique_path(path, taken):
+    """make_unique_name과 같은 규칙으로, 이미 알고 있는 경로 집합에 대해 이름을 정한다"""
+    base, ext = os.path.splitext(path)
+    counter = 1
+    new_path = path
+    while new_path in taken:
+        counter += 1
+        new_path = f"{base}_{counter}{ext}"
+    return new_path
+
+def upload_folder(repo_name, folder_path, github_root="", progress_label=None, progress_bar=None, stop_event=None, start_index=1, local_base_path=None,
+                  known_blobs=None):
+    files_list = []
+    for root, dirs, files in os.walk(folder_path):
+        for file in files:
+            files_list.append(os.path.join(root, file))
+    local_base = local_base_path if local_base_path else os.path.dirname(folder_path)
+    return upload_files(repo_name, files_list, github_root, progress_label=progress_label, progress_bar=progress_bar,
+                        stop_event=stop_event, start_index=start_index, local_base_path=local_base,
+                        known_blobs=known_blobs, message=f"Add {os.path.basename(folder_path)}")
+
+def upload_files(repo_name, files_list, github_root="", progress_label=None, progress_bar=None, stop_event=None, start_index=1, local_base_path=None,
+                 known_blobs=None, message=None):
+    """파일 목록을 커밋 하나로 올린다 (저장소에 있는 이름이면 _2, _3...).
+
+    known_blobs를 여러 번의 호출에 같이 넘기면 한 번의 드롭 안에서 같은 내용은 한 번만 올라간다.
+    local_base_path가 없으면 파일 이름만 github_root 아래에 둔다. 반환값은 처리한 파일 수.
+    """
+    total_files = len(files_list)
+    if not files_list:
+        return 0
+    if message is None:
+        message = f"Add {os.path.basename(files_list[0])}" if total_files == 1 else f"Add {total_files} files"
+    head = get_branch_head(repo_name)
+    tree = get_repo_tree(repo_name, head[2]) if head else None
+    if tree is None:
+        # 빈 저장소이거나 트리가 너무 커서 잘린 경우 파일 단위로 업로드
+        for idx, file_path in enumerate(files_list, start=start_index):
+            if stop_event and stop_event.is_set():
+                break
+            upload_file(repo_name, file_path, github_root=github_root, local_base_path=local_base_path,
+                        progress_label=progress_label, progress_bar=progress_bar, index=idx, total=total_files+start_index-1,
+                        stop_event=stop_event)
+        return total_files
+
+    taken = set(tree)
+    pairs = []
+    for file_path in files_list:
+        rel_path_local = get_relative_path(file_path, local_base_path)
+        rel_path = os.path.join(github_root, rel_path_local).replace("\\", "/") if github_root else rel_path_local.replace("\\", "/")
+        if os.path.getsize(file_path) > GITHUB_FILE_SIZE_LIMIT:
+            print(f"Skipped: {rel_path} (over GitHub limit {GITHUB_FILE_SIZE_LIMIT} bytes)")
+            STATS.add_failure()
+            continue
+        rel_path_unique = make_unique_path(rel_path, taken)
+        taken.add(rel_path_unique)
+        pairs.append((file_path, rel_path_unique))
+
+    if known_blobs is None:
+        known_blobs = set()
+    known_blobs.update(item["sha"] for item in tree.values() if item["type"] == "blob")
+    upload_files_batch(repo_name, pairs, message, head=head, known_blobs=known_blobs,
+                       progress_label=progress_label, progress_bar=progress_bar, start_index=start_index,
+                       total=total_files+start_index-1, stop_event=stop_event)
+    return total_files
+
+# =======================
+# 동기화 (바뀐 파일만 덮어쓰기)
+# =======================
+def sync_files(repo_name, pairs, message, removed=(), stop_event=None):
+    """[(로컬 경로, 저장소 경로)] 중 저장소와 내용이 다른 파일만 커밋 하나로 덮어쓴다.
+
+    removed의 저장소 경로는 저장소에 있을 때만 같은 커밋에서 삭제한다.
+    반환값은 바뀐(업로드 또는 삭제된) 파일 수. 커밋이 실패하면 RuntimeError.
+    """
+    head = get_branch_head(repo_name)
+    if head is None:
+        # 빈 저장소: 덮어쓸 파일이 없으므로 contents API로 하나씩 만든다
+        count = failed = 0
+        for file_path, repo_path in pairs:
+            if stop_event and stop_event.is_set():
+                break
+            if os.path.getsize(file_path) > GITHUB_FILE_SIZE_LIMIT:
+                print(f"Skipped: {repo_path} (over GitHub limit {GITHUB_FILE_SIZE_LIMIT} bytes)")
+                STATS.add_failure()
+                continue
+            status = put_github_contents(repo_name, file_path, repo_path)
+            if status in [200, 201]:
+                count += 1
+            else:
+                print(f"Failed: {repo_path} ({status})")
+                STATS.add_failure()
+                failed += 1
+        if failed:
+            raise RuntimeError(f"업로드 실패: {failed}개 파일")
+        return count
+    tree = get_repo_tree(repo_name, head[2]) or {}
+    changed = []
+    for file_path, repo_path in pairs:
+        if os.path.getsize(file_path) > GITHUB_FILE_SIZE_LIMIT:
+            print(f"Skipped: {repo_path} (over GitHub limit {GITHUB_FILE_SIZE_LIMIT} bytes)")
+            STATS.add_failure()
+            continue
+        if tree.get(repo_path, {}).get("sha") != git_blob_sha(file_path):
+            changed.append((file_path, repo_path))
+    removed = [path for path in removed if tree.get(path, {}).get("type") == "blob"]
+    if not changed and not removed:
+        return 0
+    known_blobs = {item["sha"] for item in tree.values() if item["type"] == "blob"}
+    if not upload_files_batch(repo_name, changed, message, head=head, known_blobs=known_blobs,
+                              stop_event=stop_event, removed=removed):
+        raise RuntimeError(f"커밋 실패: {message}")
+    return len(changed) + len(removed)
+
+def sync_folder(repo_name, folder_path, github_root="", stop_event=None):
+    """폴더 내용을 github_root 아래에 그대로 맞춘다 (로컬에 없는 파일은 지우지 않음)"""
+    pairs = []
+    for root, dirs, files in os.walk(folder_path):
+        for file in files:
+            file_path = os.path.join(root, file)
+            rel_path = os.path.relpath(file_path, folder_path).replace("\\", "/")
+            pairs.append((file_path, f"{github_root}/{rel_path}" if github_root else rel_path))
+    return sync_files(repo_name, pairs, f"Sync {os.path.basename(os.path.abspath(folder_path))}",
+                      stop_event=stop_event)
@@ -0,0 +1,274 @@
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+import requests
+
+import github_upload
+from github_upload import (
+    STATS, require_credentials, sync_files, sync_folder, upload_files, upload_folder,
+)
+
+# =======================
+# 파일 변경 감시 (Linux inotify, 그 외에는 주기적 스캔)
+# =======================
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+def iter_files(folder_path):
+    for root, dirs, files in os.walk(folder_path):
+        for file in files:
+            yield os.path.join(root, file)
+
+class InotifyWatcher:
+    """inotify로 폴더 전체를 감시하고, 바뀐 파일 경로를 돌려준다."""
+    def __init__(self, folder_path):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.folder_path = folder_path
+        self.dirs = {}
+        self.add_tree(folder_path)
+
+    def add_tree(self, dir_path):
+        for root, dirs, files in os.walk(dir_path):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(root), WATCH_MASK)
+            if wd >= 0:
+                self.dirs[wd] = root
+
+    def read_events(self, timeout):
+        """timeout 초 동안 기다려 (경로, 존재 여부) 목록을 반환"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changes = []
+        offset = 0
+        while offset < len(buf):
+            wd, mask, cookie, name_len = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = buf[offset:offset + name_len].rstrip(b"\0")
+            offset += name_len
+            if mask & IN_Q_OVERFLOW:
+                # 큐가 넘치면 어떤 파일이 바뀌었는지 알 수 없으므로 전부 다시 본다
+                changes.extend((path, True) for path in iter_files(self.folder_path))
+                continue
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            if wd not in self.dirs or not name:
+                continue
+            path = os.path.join(self.dirs[wd], os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # 새 폴더는 감시를 붙이기 전에 생긴 파일까지 함께 올린다
+                    self.add_tree(path)
+                    changes.extend((p, True) for p in iter_files(path))
+                continue
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                changes.append((path, True))
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                changes.append((path, False))
+        return changes
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """inotify가 없는 환경에서 mtime/크기를 주기적으로 비교한다."""
+    def __init__(self, folder_path):
+        self.folder_path = folder_path
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        for path in iter_files(self.folder_path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def read_events(self, timeout):
+        time.sleep(timeout)
+        current = self.scan()
+        changes = [(path, True) for path, sig in current.items() if self.snapshot.get(path) != sig]
+        changes.extend((path, False) for path in self.snapshot if path not in current)
+        self.snapshot = current
+        return changes
+
+    def close(self):
+        pass
+
+def make_watcher(folder_path):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(folder_path)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(folder_path)
+
+def watch_folder(repo_name, folder_path, github_root="", debounce=2.0, max_delay=30.0, stop_event=None, poll=0.5):
+    """변경 이벤트를 모았다가 debounce초 동안 조용해지면(늦어도 max_delay초 뒤) 커밋 하나로 올린다."""
+    folder_path = os.path.abspath(folder_path)
+    watcher = make_watcher(folder_path)
+    pending = {}
+    first_event = last_event = None
+    retry_at = 0
+    print(f"Watching {folder_path} -> {repo_name}/{github_root} ({type(watcher).__name__})")
+    try:
+        while not (stop_event and stop_event.is_set()):
+            now = time.time()
+            for path, exists in watcher.read_events(poll):
+                pending[path] = exists
+                first_event = first_event or now
+                last_event = now
+            if not pending:
+                continue
+            now = time.time()
+            if now < retry_at:
+                continue
+            if now - last_event < debounce and now - first_event < max_delay:
+                continue
+            batch, pending = pending, {}
+            first_event = last_event = None
+            try:
+                flush_changes(repo_name, folder_path, github_root, batch)
+            except (RuntimeError, OSError, requests.RequestException) as e:
+                # OSError: 이벤트와 업로드 사이에 임시/스왑 파일이 지워진 경우 등. 다음 번에는 삭제로 처리된다
+                # 실패한 변경은 버리지 않고 되돌려 놓았다가 max_delay초 뒤 다시 커밋한다
+                print(f"{time.strftime('%H:%M:%S')} {e}; retrying in {max_delay:.0f}s")
+                for path, exists in batch.items():
+                    pending.setdefault(path, exists)
+                first_event = last_event = time.time()
+                retry_at = first_event + max_delay
+    finally:
+        watcher.close()
+
+def flush_changes(repo_name, folder_path, github_root, batch):
+    pairs, removed = [], []
+    for path, exists in sorted(batch.items()):
+        rel_path = os.path.relpath(path, folder_path).replace("\\", "/")
+        repo_path = f"{github_root}/{rel_path}" if github_root else rel_path
+        # 이벤트가 쌓이는 사이에 지워졌거나 다시 생긴 파일은 현재 상태를 따른다
+        if exists and os.path.isfile(path):
+            pairs.append((path, repo_path))
+        elif not os.path.exists(path):
+            removed.append(repo_path)
+    if not pairs and not removed:
+        return
+    STATS.begin_batch(sum(os.path.getsize(p) for p, _ in pairs))
+    count = sync_files(repo_name, pairs, f"Sync {len(pairs) + len(removed)} changed files", removed=removed)
+    print(f"{time.strftime('%H:%M:%S')} committed {count} of {len(pairs) + len(removed)} changed files")
+
+# =======================
+# 명령
+# =======================
+def cmd_upload(args):
+    files = [p for p in args.paths if os.path.isfile(p)]
+    folders = [p for p in args.paths if os.path.isdir(p)]
+    total_bytes = sum(os.path.getsize(p) for p in files)
+    total_bytes += sum(os.path.getsize(p) for folder in folders for p in iter_files(folder))
+    STATS.begin_batch(total_bytes)
+    known_blobs = set()  # 파일과 폴더 전체에서 같은 내용은 한 번만 업로드
+    upload_files(args.repo, files, args.root, known_blobs=known_blobs)
+    for folder_path in folders:
+        upload_folder(args.repo, os.path.normpath(folder_path), args.root, known_blobs=known_blobs)
+    print(STATS.summary())
+    return 1 if STATS.batch_failed else 0
+
+def cmd_sync(args):
+    STATS.begin_batch(sum(os.path.getsize(p) for p in iter_files(args.folder)))
+    try:
+        count = sync_folder(args.repo, args.folder, args.root)
+    except RuntimeError as e:
+        print(e)
+        count = None
+    print(f"{count or 0} files changed")
+    print(STATS.summary())
+    return 1 if count is None or STATS.batch_failed else 0
+
+def cmd_watch(args):
+    if args.initial_sync:
+        cmd_sync(args)
+    try:
+        watch_folder(args.repo, args.folder, args.root, debounce=args.debounce, max_delay=args.max_delay)
+    except KeyboardInterrupt:
+        pass
+    print(STATS.summary())
+    return 0
+
+def read_token(token_file):
+    if token_file == "-":
+        return sys.stdin.readline().strip()
+    with open(token_file, "r", encoding="utf-8") as f:
+        return f.readline().strip()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m github_upload_cli",
+                                     description="GitHub 업로드 (GUI 없이)")
+    parser.add_argument("--user", help="GITHUB_USER 대신 사용할 사용자 이름")
+    # 명령줄 인자는 ps나 셸 기록에 남으므로 토큰은 파일이나 표준 입력으로만 받는다
+    parser.add_argument("--token-file", help="GITHUB_TOKEN 대신 이 파일의 첫 줄을 토큰으로 사용 (-는 표준 입력)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("upload", help="파일/폴더 업로드 (이름이 겹치면 _2, _3... 으로)")
+    p.add_argument("repo")
+    p.add_argument("paths", nargs="+")
+    p.add_argument("--root", default="", help="저장소 안의 대상 폴더")
+    p.set_defaults(func=cmd_upload)
+
+    p = sub.add_parser("sync", help="폴더 내용을 저장소에 덮어쓰기 (바뀐 파일만)")
+    p.add_argument("repo")
+    p.add_argument("folder")
+    p.add_argument("--root", default="", help="저장소 안의 대상 폴더")
+    p.set_defaults(func=cmd_sync)
+
+    p = sub.add_parser("watch", help="폴더를 감시하며 바뀐 파일을 모아서 커밋")
+    p.add_argument("repo")
+    p.add_argument("folder")
+    p.add_argument("--root", default="", help="저장소 안의 대상 폴더")
+    p.add_argument("--debounce", type=float, default=2.0, help="마지막 변경 후 기다릴 초")
+    p.add_argument("--max-delay", type=float, default=30.0, help="변경이 계속돼도 이 초가 지나면 커밋")
+    p.add_argument("--no-initial-sync", dest="initial_sync", action="store_false",
+                   help="시작할 때 전체 동기화를 하지 않음")
+    p.set_defaults(func=cmd_watch)
+
+    args = parser.parse_args(argv)
+    if args.user:
+        github_upload.GITHUB_USER = args.user
+    if args.token_file:
+        try:
+            github_upload.GITHUB_TOKEN = read_token(args.token_file) or None
+        except OSError as e:
+            parser.error(str(e))
+    try:
+        require_credentials()
+    except ValueError as e:
+        parser.error(str(e))
+    # 스크립트/스케줄러에서 쓸 수 있도록 파일이나 커밋이 하나라도 실패하면 0이 아닌 종료 코드
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import argparse
+import os
+import re
+
+from atomic_file import write_atomic
+
+# =======================
+# 템플릿 블록 끼워넣기 (temp_main.py + block.txt -> main.py)
+# =======================
+# 템플릿의 "//블록" 또는 "//블럭" 마커 줄을 블록 내용으로 바꾼다.
+# "//블록:이름" 처럼 이름을 붙이면 여러 블록을 각각 다른 자리에 넣을 수 있다 (이름 없는 마커는 "").
+# 템플릿은 마커 위치만 한 번 찾아 조각 목록으로 만들어 두고(수정 시각으로 캐시),
+# 결과는 str.join 한 번으로 만든다.
+MARKER_RE = re.compile(r"^[^\n]*//\s*블[록럭](?:\s*:\s*([\w.-]+))?[^\n]*(?:\n|$)", re.M)
+
+_compiled_cache = {}  # 템플릿 경로 -> ((mtime_ns, size), 조각 목록)
+
+def compile_template(text):
+    """템플릿을 [문자열, ("block", 이름), 문자열, ...] 조각 목록으로"""
+    parts = []
+    pos = 0
+    for match in MARKER_RE.finditer(text):
+        parts.append(text[pos:match.start()])
+        parts.append(("block", match.group(1) or ""))
+        pos = match.end()
+    parts.append(text[pos:])
+    return parts
+
+def load_template(path):
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _compiled_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        parts = compile_template(f.read())
+    _compiled_cache[path] = (key, parts)
+    return parts
+
+def render(parts, blocks):
+    """blocks: {이름: 내용}. 없는 이름의 마커는 원래처럼 빈 줄로 남는다"""
+    out = []
+    for part in parts:
+        if isinstance(part, tuple):
+            out.append(blocks.get(part[1], ""))
+            out.append("\n")  # 삽입 후 줄바꿈 추가
+        else:
+            out.append(part)
+    return "".join(out)
+
+def load_blocks(block_paths):
+    """{이름: 파일 경로} -> {이름: 내용}"""
+    blocks = {}
+    for name, path in block_paths.items():
+        with open(path, "r", encoding="utf-8") as f:
+            blocks[name] = f.read()
+    return blocks
+
+def splice_file(template_path, block_paths, out_path):
+    if isinstance(block_paths, str):
+        block_paths = {"": block_paths}
+    write_atomic(out_path, render(load_template(template_path), load_blocks(block_paths)))
+
+def splice_batch(jobs):
+    """[(템플릿 경로, 블록 경로 또는 {이름: 경로}, 출력 경로)]를 한꺼번에 처리한다.
+
+    같은 템플릿/블록 파일은 한 번만 읽는다.
+    """
+    block_texts = {}
+    for template_path, block_paths, out_path in jobs:
+        if isinstance(block_paths, str):
+            block_paths = {"": block_paths}
+        blocks = {}
+        for name, path in block_paths.items():
+            if path not in block_texts:
+                block_texts[path] = load_blocks({"": path})[""]
+            blocks[name] = block_texts[path]
+        write_atomic(out_path, render(load_template(template_path), blocks))
+
+def main():
+    parser = argparse.ArgumentParser(description="템플릿의 //블록 마커 자리에 블록 파일 내용을 넣는다")
+    parser.add_argument("template", nargs="?", default="temp_main.py")
+    parser.add_argument("block", nargs="?", default="block.txt", help="이름 없는 마커에 넣을 파일")
+    parser.add_argument("out", nargs="?", default="main.py")
+    parser.add_argument("--named", action="append", default=[], metavar="이름=파일",
+                        help="//블록:이름 마커에 넣을 파일 (여러 번 지정 가능)")
+    args = parser.parse_args()
+    block_paths = {"": args.block}
+    for item in args.named:
+        name, _, path = item.partition("=")
+        block_paths[name] = path
+    splice_file(args.template, block_paths, args.out)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from atomic_file import write_atomic
+
+def test_write_text(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("old")
+    write_atomic(str(path), "새 내용\r\n", newline="")
+    assert path.read_bytes() == "새 내용\r\n".encode()
+    assert os.listdir(tmp_path) == ["a.txt"]
+
+def test_write_text_with_bom(tmp_path):
+    path = tmp_path / "a.cs"
+    write_atomic(str(path), "x", "utf-8-sig")
+    assert path.read_bytes() == b"\xef\xbb\xbfx"
+
+def test_write_bytes(tmp_path):
+    path = tmp_path / "a.bin"
+    write_atomic(str(path), b"\x00\x01")
+    assert path.read_bytes() == b"\x00\x01"
+
+def test_temp_file_removed_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "a.txt"
+    path.write_text("old")
+    def fail(src, dst):
+        raise OSError("replace failed")
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        write_atomic(str(path), "new")
+    assert os.listdir(tmp_path) == ["a.txt"]
+    assert path.read_text() == "old"
@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+from block_workspace import WorkspaceStore, dumps_binary, loads_binary
+
+def record(label, x=0):
+    return {"json": {"라벨": label}, "x": x, "y": 0, "w": 150, "h": 40}
+
+def test_binary_round_trip():
+    workspace = {"a": record("a", 5), "b": record("b")}
+    assert loads_binary(dumps_binary(workspace)) == workspace
+
+@pytest.mark.parametrize("data", [b"junk", dumps_binary({"a": record("a")})[:-3]])
+def test_corrupt_binary_is_value_error(data):
+    with pytest.raises(ValueError):
+        loads_binary(data)
+
+def test_half_written_journal_line_is_truncated(tmp_path):
+    base = str(tmp_path / "ws")
+    store = WorkspaceStore(base)
+    store.load()
+    store.put("a", record("a"))
+    store.flush()
+    with open(store.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"label": "b", "blo')  # 쓰다가 죽은 줄
+
+    # 다음 실행: 쓰다 만 줄 뒤에 이어 쓰지 않아야 c, d가 남는다
+    store = WorkspaceStore(base)
+    assert list(store.load()) == ["a"]
+    store.put("c", record("c"))
+    store.put("d", record("d"))
+    store.flush()
+
+    assert sorted(WorkspaceStore(base).load()) == ["a", "c", "d"]
+
+def test_replace_all_is_written_by_flush(tmp_path):
+    store = WorkspaceStore(str(tmp_path / "ws"))
+    store.load()
+    store.put("old", record("old"))
+    store.replace_all({"a": record("a")})
+    assert not os.path.exists(store.snapshot_path)  # 부른 쪽에서는 쓰지 않는다
+    store.put("b", record("b"))
+    store.flush()
+    assert sorted(WorkspaceStore(str(tmp_path / "ws")).load()) == ["a", "b"]
@@ -0,0 +1,108 @@
+import pytest
+
+import cs_function_index
+from cs_function_index import apply_mappings, index_functions, process_file
+
+def names(src):
+    return [span.name for span in index_functions(src)]
+
+def body(src, span):
+    return src[span.open + 1:span.close]
+
+# =======================
+# 색인
+# =======================
+def test_methods_and_control_blocks():
+    src = """
+class A {
+    void Foo() { if (x) { y(); } }
+    int Bar<T>(T a) where T : class { while (a != null) { } return 1; }
+}
+"""
+    assert names(src) == ["Foo", "Bar"]
+
+def test_braces_in_strings_and_comments_are_ignored():
+    src = """
+void Foo() {
+    var s = "}{";
+    var c = '}';
+    var v = @"line ""}"" {";
+    var i = $"{(x ? "}" : "{")} {{";
+    // }
+    /* { */
+}
+void Bar() { }
+"""
+    spans = index_functions(src)
+    assert [s.name for s in spans] == ["Foo", "Bar"]
+    assert body(src, spans[0]).rstrip().endswith("/* { */")
+
+def test_local_function_depth():
+    src = "class A { void Outer() { int Inner(int x) { return x; } } }"
+    spans = {s.name: s for s in index_functions(src)}
+    assert spans["Outer"].depth == 1
+    assert spans["Inner"].depth == 2
+
+@pytest.mark.parametrize("initializer", [": base(x)", ": this(x, 0)", ": base(Make(x))"])
+def test_constructor_initializer(initializer):
+    src = f"class A : B {{ public A(int x) {initializer} {{ Init(); }} }}"
+    spans = index_functions(src)
+    assert [s.name for s in spans] == ["A"]
+    assert src[spans[0].start:].startswith("A(int x)")
+
+@pytest.mark.parametrize("expr", ["new Person() { Name = \"a\" }", "new List<int>() { 1, 2 }", "new() { X = 1 }"])
+def test_object_initializer_is_not_a_function(expr):
+    src = f"void Foo() {{ var p = {expr}; }}"
+    assert names(src) == ["Foo"]
+
+# =======================
+# 매핑 적용
+# =======================
+MAPPINGS = [
+    {"함수이름": "DistanceAdd", "변수이름": "distance", "값": 3, "블럭타입": "붙이기"},
+    {"함수이름": "SpeedSet", "변수이름": "speed", "값": 7, "블럭타입": "바꾸기"},
+]
+
+SOURCE = """void DistanceAdd()
+{
+    distance = 5;
+}
+
+void SpeedSet()
+{
+    speed = 2;
+}
+"""
+
+def test_apply_mappings():
+    out = apply_mappings(SOURCE, MAPPINGS)
+    assert "    distance = 5;\n    distance += 3;  // 붙이기 블록\n}" in out
+    assert "{\n    speed = 7;  // 바꾸기 블록\n}" in out
+    assert "speed = 2;" not in out
+
+def test_apply_mappings_is_idempotent():
+    once = apply_mappings(SOURCE, MAPPINGS)
+    assert apply_mappings(once, MAPPINGS) == once
+
+def test_apply_mappings_keeps_crlf():
+    src = SOURCE.replace("\n", "\r\n")
+    out = apply_mappings(src, MAPPINGS)
+    assert out.count("\r\n") == out.count("\n")
+
+# =======================
+# 파일 처리
+# =======================
+def test_process_file_keeps_bom(tmp_path):
+    path = tmp_path / "A.cs"
+    path.write_bytes(b"\xef\xbb\xbf" + SOURCE.encode())
+    _, _, _, changed = process_file(str(path), cs_function_index.group_mappings(MAPPINGS))
+    assert changed
+    data = path.read_bytes()
+    assert data.startswith(b"\xef\xbb\xbf") and not data.startswith(b"\xef\xbb\xbf" * 2)
+    assert b"distance += 3;" in data
+
+def test_process_file_without_bom(tmp_path):
+    path = tmp_path / "A.cs"
+    path.write_bytes(SOURCE.encode())
+    process_file(str(path), cs_function_index.group_mappings(MAPPINGS))
+    assert not path.read_bytes().startswith(b"\xef\xbb\xbf")